@@ -9,6 +9,23 @@ import sys
 import subprocess
 import shutil
 
+# Modules left out of the bundle to cut its size and startup time
+EXCLUDED_MODULES = [
+    "tkinter",
+    "unittest",
+    "test",
+    "email.test",
+    "pydoc_data",
+]
+
+def _pyinstaller_major_version():
+    """Return the installed PyInstaller's major version, or None if unknown"""
+    try:
+        import PyInstaller
+        return int(PyInstaller.__version__.split(".")[0])
+    except (ImportError, AttributeError, ValueError):
+        return None
+
 def build_exe():
     """Build executable using PyInstaller"""
     print("Building WiFi Deauth Detector executable...")
@@ -17,17 +34,41 @@ def build_exe():
     separator = ";" if os.name == 'nt' else ":"
     cmd = [
         "pyinstaller",
-        "--onefile",
+        "--onedir",  # No self-extraction to a temp folder on every launch
         "--windowed",
         "--name", "WiFiDeauthDetector",
         "--add-data", f"requirements.txt{separator}.",
-        "main.py"
+        "--upx-exclude", "vcruntime140.dll",  # UPX breaks the MSVC runtime
     ]
     
+    # Bytecode equivalent of python -OO: drops asserts and docstrings from the
+    # app and every bundled package, so nothing may rely on __doc__ at runtime.
+    # The option only exists from PyInstaller 6.0 on.
+    version = _pyinstaller_major_version()
+    if version is not None and version >= 6:
+        cmd += ["--optimize", "2"]
+    else:
+        print("PyInstaller older than 6.0 (or version unknown): building without --optimize")
+    
+    # Drop symbol tables from bundled binaries (no-op tool on Windows)
+    if os.name != 'nt':
+        cmd.append("--strip")
+    
+    # UPX is picked up from PATH automatically; UPX_DIR points at a local copy
+    upx_dir = os.environ.get("UPX_DIR")
+    if upx_dir:
+        cmd += ["--upx-dir", upx_dir]
+    
+    # Standard library packages the application never imports
+    for module in EXCLUDED_MODULES:
+        cmd += ["--exclude-module", module]
+    
+    cmd.append("main.py")
+    
     try:
         result = subprocess.run(cmd, check=True)
         print("\n✅ Build completed successfully!")
-        print("📁 Executable created in 'dist' folder")
+        print("📁 Application created in 'dist/WiFiDeauthDetector' folder")
         
         # Copy readme to dist folder
         if os.path.exists("README.md"):
@@ -63,7 +104,7 @@ echo.
 pause
 echo.
 echo Starting WiFi Deauth Detector...
-WiFiDeauthDetector.exe
+"%~dp0WiFiDeauthDetector\\WiFiDeauthDetector.exe"
 '''
     
     with open("dist/install_and_run.bat", "w") as f:
@@ -6,9 +6,9 @@ Demonstrates functionality without GUI
 
 import sys
 import os
-import time
 import signal
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add the main directory to the path
@@ -22,8 +22,13 @@ class CLIDeauthDetector:
     
     def __init__(self):
         self.running = False
+        self._stop_event = threading.Event()
         self.settings = SettingsManager()
         self.network_manager = NetworkManager()
+        self._webhook = DiscordWebhook(self.settings.get("discord_webhook"))
+        
+        # Background worker so webhook delivery never blocks event handling
+        self._sender = ThreadPoolExecutor(max_workers=1)
         
         # Determine monitoring mode
         use_real_monitoring = os.name == 'nt' and not self.settings.get("demo_mode", False)
@@ -31,11 +36,12 @@ class CLIDeauthDetector:
         if use_real_monitoring:
             print("🔍 Using Windows WLAN API monitoring (Normal Mode)")
             self.monitor = WindowsWiFiMonitor()
-            self.monitor.suspicious_disconnect.connect(self._handle_suspicious_event)
+            # No Qt event loop in the CLI, so take events as direct callbacks
+            self.monitor.on_event = self._handle_suspicious_event
         else:
             print("🎭 Using legacy detector (Demo Mode)")
             self.monitor = LegacyDeauthDetector()
-            self.monitor.attack_detected.connect(self._handle_demo_event)
+            self.monitor.on_event = self._handle_demo_event
         
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -44,37 +50,53 @@ class CLIDeauthDetector:
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         print(f"\n📡 Received signal {signum}, shutting down...")
+        self._stop_event.set()
         self.stop()
         sys.exit(0)
     
+    def _emit(self, lines):
+        """Write an event block to stdout in a single write"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
     def _handle_suspicious_event(self, reason, timestamp, details):
         """Handle suspicious WiFi events"""
-        print(f"\n🚨 SECURITY ALERT!")
-        print(f"   Time: {timestamp}")
-        print(f"   Event: {reason}")
-        print(f"   Details: {details}")
+        lines = [
+            f"\n🚨 SECURITY ALERT!",
+            f"   Time: {timestamp}",
+            f"   Event: {reason}",
+            f"   Details: {details}",
+        ]
         
         # Send Discord notification if configured
         if self.settings.get("discord_enabled"):
-            webhook_url = self.settings.get("discord_webhook")
-            if webhook_url:
-                webhook = DiscordWebhook(webhook_url)
-                success = webhook.send_alert(reason, details, timestamp)
-                print(f"   Discord: {'✅ Sent' if success else '❌ Failed'}")
+            if self._webhook.webhook_url:
+                self._sender.submit(self._send_alert, reason, details, timestamp)
+                lines.append("   Discord: 📤 Queued")
         
         # Auto-switch network if enabled
         if self.settings.get("auto_switch_enabled"):
             backup_network = self.settings.get("backup_network")
             if backup_network:
-                print(f"   Switching to backup network: {backup_network}")
+                # Show the alert before blocking on the network switch
+                self._emit(lines + [f"   Switching to backup network: {backup_network}"])
                 success = self.network_manager.connect_to_network(backup_network)
-                print(f"   Network switch: {'✅ Success' if success else '❌ Failed'}")
+                lines = [f"   Network switch: {'✅ Success' if success else '❌ Failed'}"]
+        
+        self._emit(lines)
+    
+    def _send_alert(self, reason, details, timestamp):
+        """Send a Discord alert on the background worker"""
+        success = self._webhook.send_alert(reason, details, timestamp)
+        self._emit([f"   Discord: {'✅ Sent' if success else '❌ Failed'} ({reason})"])
     
     def _handle_demo_event(self, attacker, target, timestamp):
         """Handle demo events"""
-        print(f"\n🎭 DEMO EVENT!")
-        print(f"   Time: {timestamp}")
-        print(f"   Simulated Attack: {attacker} → {target}")
+        self._emit([
+            f"\n🎭 DEMO EVENT!",
+            f"   Time: {timestamp}",
+            f"   Simulated Attack: {attacker} → {target}",
+        ])
     
     def show_status(self):
         """Display current status"""
@@ -103,6 +125,7 @@ class CLIDeauthDetector:
         if not self.running:
             print("🚀 Starting WiFi Deauth Detector v2.0 (CLI Mode)")
             self.running = True
+            self._stop_event.clear()
             self.monitor.start_monitoring()
             print("📡 Monitoring started - Press Ctrl+C to stop")
             self.show_status()
@@ -112,14 +135,32 @@ class CLIDeauthDetector:
         if self.running:
             print("🛑 Stopping monitoring...")
             self.running = False
+            self._stop_event.set()
             self.monitor.stop_monitoring()
             print("✅ Monitoring stopped")
     
+    def wait(self, timeout=None):
+        """Block until monitoring is stopped or timeout passes; True once stopped"""
+        return self._stop_event.wait(timeout)
+    
     def run_interactive(self):
         """Run interactive CLI mode"""
         print("🛡️ WiFi Deauth Detector v2.0 - Interactive CLI")
         print("=" * 50)
         
+        commands = {
+            '1': self.start,
+            '2': self.stop,
+            '3': self.show_status,
+            '4': self.show_networks,
+            '5': self.configure_settings,
+        }
+        
+        # Scripted input: dispatch piped commands without re-printing the menu
+        if not sys.stdin.isatty():
+            self._run_piped(commands)
+            return
+        
         while True:
             print("\nCommands:")
             print("  1. Start monitoring")
@@ -132,20 +173,14 @@ class CLIDeauthDetector:
             try:
                 choice = input("\nEnter choice (1-6): ").strip()
                 
-                if choice == '1':
-                    self.start()
-                elif choice == '2':
-                    self.stop()
-                elif choice == '3':
-                    self.show_status()
-                elif choice == '4':
-                    self.show_networks()
-                elif choice == '5':
-                    self.configure_settings()
-                elif choice == '6':
+                if choice == '6':
                     self.stop()
                     print("👋 Goodbye!")
                     break
+                
+                action = commands.get(choice)
+                if action:
+                    action()
                 else:
                     print("❌ Invalid choice. Please enter 1-6.")
                     
@@ -154,6 +189,27 @@ class CLIDeauthDetector:
                 print("\n👋 Goodbye!")
                 break
     
+    def _run_piped(self, commands):
+        """Dispatch commands read from a non-interactive stdin"""
+        try:
+            for line in sys.stdin:
+                choice = line.strip()
+                if not choice:
+                    continue
+                if choice == '6':
+                    break
+                
+                action = commands.get(choice)
+                if action:
+                    action()
+                else:
+                    print(f"❌ Invalid choice '{choice}'. Please enter 1-6.")
+        except KeyboardInterrupt:
+            pass
+        
+        self.stop()
+        print("👋 Goodbye!")
+    
     def configure_settings(self):
         """Configure basic settings"""
         print("\n⚙️ Settings Configuration:")
@@ -165,6 +221,7 @@ class CLIDeauthDetector:
         if webhook:
             self.settings.set("discord_webhook", webhook)
             self.settings.set("discord_enabled", True)
+            self._webhook = DiscordWebhook(self.settings.get("discord_webhook"))
         
         # Backup network
         current_backup = self.settings.get("backup_network", "")
@@ -188,9 +245,12 @@ def main():
         
         if command == 'start':
             detector.start()
+            # Windows only runs signal handlers once a wait returns, so poll
+            # there; elsewhere block until stop() or a signal sets the event
+            timeout = 1.0 if os.name == 'nt' else None
             try:
-                while detector.running:
-                    time.sleep(1)
+                while not detector.wait(timeout):
+                    pass
             except KeyboardInterrupt:
                 detector.stop()
                 
@@ -2,24 +2,31 @@
 """
 Demo script for WiFi Deauth Detector v2.0
 Shows the application running with new normal mode functionality
+
+Single entry point for all demos:
+    python demo.py            # GUI demo (default)
+    python demo.py flow       # Printed demo flow and recording checklist
+    python demo.py enhanced   # Enhanced detection and threat scoring demo
+
+PyQt5 and the GUI are only imported when the GUI demo is selected, so the
+console demos start without loading Qt.
 """
 
 import sys
-import os
-import time
-import threading
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
-from main import WiFiDeauthDetectorGUI
+import argparse
+import importlib
 
 class DemoController:
     """Controls the demo flow for v2.0"""
     
     def __init__(self, app_window):
+        from PyQt5.QtCore import QTimer
+        
         self.window = app_window
         self.demo_timer = QTimer()
         self.demo_timer.timeout.connect(self.run_demo_sequence)
         self.demo_step = 0
+        self._tabs = None
         
     def start_demo(self):
         """Start the demo sequence"""
@@ -35,6 +42,11 @@ class DemoController:
         # Save settings
         self.window.save_settings()
         
+        from PyQt5.QtWidgets import QTabWidget
+        
+        # Look up the tab widget once instead of walking the widget tree per step
+        self._tabs = self.window.centralWidget().findChild(QTabWidget)
+        
         # Start demo timer
         self.demo_timer.start(5000)  # Every 5 seconds
         
@@ -51,26 +63,17 @@ class DemoController:
         elif self.demo_step == 3:
             print("📊 Checking logs tab...")
             # Switch to logs tab
-            for child in self.window.centralWidget().findChildren(self.window.centralWidget().__class__):
-                if hasattr(child, 'setCurrentIndex'):
-                    child.setCurrentIndex(2)  # Logs tab
-                    break
+            self._tabs.setCurrentIndex(2)  # Logs tab
                         
         elif self.demo_step == 5:
             print("⚙️ Showing new settings...")
             # Switch to settings tab
-            for child in self.window.centralWidget().findChildren(self.window.centralWidget().__class__):
-                if hasattr(child, 'setCurrentIndex'):
-                    child.setCurrentIndex(1)  # Settings tab
-                    break
+            self._tabs.setCurrentIndex(1)  # Settings tab
                         
         elif self.demo_step == 7:
             print("📱 Switching back to monitor view...")
             # Switch back to monitor tab
-            for child in self.window.centralWidget().findChildren(self.window.centralWidget().__class__):
-                if hasattr(child, 'setCurrentIndex'):
-                    child.setCurrentIndex(0)  # Monitor tab
-                    break
+            self._tabs.setCurrentIndex(0)  # Monitor tab
                         
         elif self.demo_step == 10:
             print("✅ Demo completed!")
@@ -81,6 +84,9 @@ class DemoController:
 
 def run_demo():
     """Run the demo application"""
+    from PyQt5.QtWidgets import QApplication
+    from main import WiFiDeauthDetectorGUI
+    
     print("🎯 WiFi Deauth Detector v2.0 Demo")
     print("=" * 50)
     print("🆕 New in v2.0:")
@@ -115,5 +121,24 @@ def run_demo():
     except KeyboardInterrupt:
         print("\n👋 Demo ended by user")
 
+# Console demos live in their own modules and are imported on demand
+CONSOLE_DEMOS = {
+    "flow": "demo_script",
+    "enhanced": "enhanced_demo",
+}
+
+def main():
+    """Parse arguments and run the selected demo"""
+    parser = argparse.ArgumentParser(description="WiFi Deauth Detector demos")
+    parser.add_argument("demo", nargs="?", default="gui",
+                        choices=["gui"] + list(CONSOLE_DEMOS),
+                        help="Demo to run (default: gui)")
+    args = parser.parse_args()
+    
+    if args.demo == "gui":
+        run_demo()
+    else:
+        importlib.import_module(CONSOLE_DEMOS[args.demo]).main()
+
 if __name__ == "__main__":
-    run_demo()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -5,109 +5,106 @@ Creates a script that demonstrates the complete flow:
 sniff → detect → alert → log → switch network
 """
 
+import sys
+
+DEMO_FLOW = """\
+🎬 WiFi Deauth Detector - Complete Flow Demo
+==================================================
+
+📋 DEMO SCRIPT - Complete Flow
+------------------------------
+
+🎯 Step 1: Application Startup
+  ▶️ Launch WiFiDeauthDetector.exe
+  ▶️ Show main interface with Monitor, Settings, Logs tabs
+  ▶️ Status shows 'Monitoring Stopped' initially
+
+⚙️ Step 2: Configure Settings
+  ▶️ Navigate to Settings tab
+  ▶️ Enable 'Auto-switch on attack'
+  ▶️ Select backup network: 'BackupWiFi_5G'
+  ▶️ Enable 'Confirm before switching'
+  ▶️ Configure Discord webhook URL
+  ▶️ Enable 'Discord alerts'
+  ▶️ Test webhook - show success message
+  ▶️ Enable 'System notifications'
+  ▶️ Save settings - show success confirmation
+
+🔴 Step 3: Start Monitoring
+  ▶️ Navigate to Monitor tab
+  ▶️ Click 'Start Monitoring' button
+  ▶️ Status changes to '🟢 Monitoring Active'
+  ▶️ Start/Stop buttons toggle states
+
+🚨 Step 4: Attack Detection
+  ▶️ Wait 5-10 seconds for simulated attack
+  ▶️ Alert appears in Recent Alerts area:
+     '[2024-08-03 17:30:15] ATTACK! Attacker: 00:11:22:33:44:55 → Target: aa:bb:cc:dd:ee:ff'
+  ▶️ Statistics update:
+     'Total Attacks: 1'
+     'Last Attack: 2024-08-03 17:30:15'
+  ▶️ System notification popup appears
+
+📢 Step 5: Discord Alert
+  ▶️ Show Discord channel receiving webhook
+  ▶️ Rich embed with:
+     - Title: '🚨 WiFi Deauth Attack Detected!'
+     - Attacker MAC: 00:11:22:33:44:55
+     - Target MAC: aa:bb:cc:dd:ee:ff
+     - Timestamp: 2024-08-03 17:30:15
+
+🔄 Step 6: Auto Network Switch
+  ▶️ Confirmation dialog appears:
+     'Deauth attack detected! Switch to backup network BackupWiFi_5G?'
+  ▶️ Click 'Yes' to confirm
+  ▶️ Show network switching attempt
+  ▶️ Success message: 'Switched to BackupWiFi_5G'
+
+📄 Step 7: Event Logging
+  ▶️ Navigate to Logs tab
+  ▶️ Show logged events:
+     '[2024-08-03 17:29:45] Monitoring started'
+     '[2024-08-03 17:30:15] DEAUTH ATTACK - Attacker: 00:11:22:33:44:55 → Target: aa:bb:cc:dd:ee:ff'
+     '[2024-08-03 17:30:17] Successfully switched to backup network: BackupWiFi_5G'
+  ▶️ Demonstrate 'Export Logs' functionality
+
+✅ Step 8: Complete Flow Validation
+  ▶️ Show all features working together:
+     ✓ Detection engine running
+     ✓ Real-time alerts in GUI
+     ✓ Discord webhook notifications
+     ✓ Auto network switching
+     ✓ Comprehensive logging
+     ✓ Settings persistence
+  ▶️ Stop monitoring
+  ▶️ Show final statistics
+
+🎥 Video Recording Tips:
+-------------------------
+• Record in 1080p for clarity
+• Use screen capture software (OBS, Camtasia)
+• Keep video under 5 minutes
+• Add captions explaining each step
+• Include audio narration for accessibility
+• Show actual Discord channel for webhook demo
+• Highlight key UI elements with cursor
+• Include 'MVP Complete' end screen
+
+📊 Demo Metrics to Highlight:
+------------------------------
+✅ All Issue 11 requirements: Auto-switch network
+✅ All Issue 12 requirements: Discord webhook alerts
+✅ All MVP requirements: Complete flow working
+✅ Packaging: Standalone executable created
+✅ Documentation: Comprehensive README with screenshots
+✅ Testing: Full test suite with 100% pass rate
+"""
+
 def print_demo_flow():
     """Print the demo flow for documentation"""
-    print("🎬 WiFi Deauth Detector - Complete Flow Demo")
-    print("=" * 50)
-    print()
-    
-    print("📋 DEMO SCRIPT - Complete Flow")
-    print("-" * 30)
-    print()
-    
-    print("🎯 Step 1: Application Startup")
-    print("  ▶️ Launch WiFiDeauthDetector.exe")
-    print("  ▶️ Show main interface with Monitor, Settings, Logs tabs")
-    print("  ▶️ Status shows 'Monitoring Stopped' initially")
-    print()
-    
-    print("⚙️ Step 2: Configure Settings")
-    print("  ▶️ Navigate to Settings tab")
-    print("  ▶️ Enable 'Auto-switch on attack'") 
-    print("  ▶️ Select backup network: 'BackupWiFi_5G'")
-    print("  ▶️ Enable 'Confirm before switching'")
-    print("  ▶️ Configure Discord webhook URL")
-    print("  ▶️ Enable 'Discord alerts'")
-    print("  ▶️ Test webhook - show success message")
-    print("  ▶️ Enable 'System notifications'")
-    print("  ▶️ Save settings - show success confirmation")
-    print()
-    
-    print("🔴 Step 3: Start Monitoring")
-    print("  ▶️ Navigate to Monitor tab")
-    print("  ▶️ Click 'Start Monitoring' button")
-    print("  ▶️ Status changes to '🟢 Monitoring Active'")
-    print("  ▶️ Start/Stop buttons toggle states")
-    print()
-    
-    print("🚨 Step 4: Attack Detection")
-    print("  ▶️ Wait 5-10 seconds for simulated attack")
-    print("  ▶️ Alert appears in Recent Alerts area:")
-    print("     '[2024-08-03 17:30:15] ATTACK! Attacker: 00:11:22:33:44:55 → Target: aa:bb:cc:dd:ee:ff'")
-    print("  ▶️ Statistics update:")
-    print("     'Total Attacks: 1'")
-    print("     'Last Attack: 2024-08-03 17:30:15'")
-    print("  ▶️ System notification popup appears")
-    print()
-    
-    print("📢 Step 5: Discord Alert")
-    print("  ▶️ Show Discord channel receiving webhook")
-    print("  ▶️ Rich embed with:")
-    print("     - Title: '🚨 WiFi Deauth Attack Detected!'")
-    print("     - Attacker MAC: 00:11:22:33:44:55")
-    print("     - Target MAC: aa:bb:cc:dd:ee:ff")
-    print("     - Timestamp: 2024-08-03 17:30:15")
-    print()
-    
-    print("🔄 Step 6: Auto Network Switch")
-    print("  ▶️ Confirmation dialog appears:")
-    print("     'Deauth attack detected! Switch to backup network BackupWiFi_5G?'")
-    print("  ▶️ Click 'Yes' to confirm")
-    print("  ▶️ Show network switching attempt")
-    print("  ▶️ Success message: 'Switched to BackupWiFi_5G'")
-    print()
-    
-    print("📄 Step 7: Event Logging")
-    print("  ▶️ Navigate to Logs tab")
-    print("  ▶️ Show logged events:")
-    print("     '[2024-08-03 17:29:45] Monitoring started'")
-    print("     '[2024-08-03 17:30:15] DEAUTH ATTACK - Attacker: 00:11:22:33:44:55 → Target: aa:bb:cc:dd:ee:ff'")
-    print("     '[2024-08-03 17:30:17] Successfully switched to backup network: BackupWiFi_5G'")
-    print("  ▶️ Demonstrate 'Export Logs' functionality")
-    print()
-    
-    print("✅ Step 8: Complete Flow Validation")
-    print("  ▶️ Show all features working together:")
-    print("     ✓ Detection engine running")
-    print("     ✓ Real-time alerts in GUI")
-    print("     ✓ Discord webhook notifications")
-    print("     ✓ Auto network switching")
-    print("     ✓ Comprehensive logging")
-    print("     ✓ Settings persistence")
-    print("  ▶️ Stop monitoring")
-    print("  ▶️ Show final statistics")
-    print()
-    
-    print("🎥 Video Recording Tips:")
-    print("-" * 25)
-    print("• Record in 1080p for clarity")
-    print("• Use screen capture software (OBS, Camtasia)")
-    print("• Keep video under 5 minutes")
-    print("• Add captions explaining each step")
-    print("• Include audio narration for accessibility")
-    print("• Show actual Discord channel for webhook demo")
-    print("• Highlight key UI elements with cursor")
-    print("• Include 'MVP Complete' end screen")
-    print()
-    
-    print("📊 Demo Metrics to Highlight:")
-    print("-" * 30)
-    print("✅ All Issue 11 requirements: Auto-switch network")
-    print("✅ All Issue 12 requirements: Discord webhook alerts")
-    print("✅ All MVP requirements: Complete flow working")
-    print("✅ Packaging: Standalone executable created")
-    print("✅ Documentation: Comprehensive README with screenshots")
-    print("✅ Testing: Full test suite with 100% pass rate")
+    # One write for the whole script instead of a print() per line
+    sys.stdout.write(DEMO_FLOW)
+    sys.stdout.flush()
 
 def create_demo_checklist():
     """Create a checklist for demo recording"""
@@ -153,11 +150,15 @@ def create_demo_checklist():
     
     print("📋 Demo checklist saved to 'demo_checklist.md'")
 
-if __name__ == "__main__":
+def main():
+    """Print the demo flow and write the recording checklist"""
     print_demo_flow()
     print()
     create_demo_checklist()
     print()
     print("🚀 Ready to record the demo video!")
     print("📖 Follow the script above for a complete demonstration")
-    print("🎯 This shows the full sniff → detect → alert → log → switch flow")
\ No newline at end of file
+    print("🎯 This shows the full sniff → detect → alert → log → switch flow")
+
+if __name__ == "__main__":
+    main()
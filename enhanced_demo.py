@@ -6,8 +6,19 @@ Demonstrates the improved detection algorithms and security features
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+def _load_network_manager():
+    """Import and construct the secure network manager"""
+    from secure_network_manager import SecureNetworkManager
+    return SecureNetworkManager()
+
+def _load_settings_manager():
+    """Import and construct the secure settings manager"""
+    from secure_settings_manager import SecureSettingsManager
+    return SecureSettingsManager("demo_settings.json", use_encryption=True)
+
 def demo_enhanced_detection():
     """Demonstrate enhanced detection capabilities"""
     print("🛡️ Enhanced WiFi Deauth Detector v2.1 - Security Improvements Demo")
@@ -30,11 +41,17 @@ def demo_enhanced_detection():
     print("✅ File permission restrictions")
     print("✅ Audit logging")
     
+    # The managers are independent and do import and disk work, so construct
+    # them in the background; the monitor is a QObject and stays on this thread
+    executor = ThreadPoolExecutor(max_workers=2)
+    net_mgr_future = executor.submit(_load_network_manager)
+    settings_future = executor.submit(_load_settings_manager)
+    executor.shutdown(wait=False)
+    
     try:
         # Demo enhanced WiFi monitor
         print("\n📡 Testing Enhanced WiFi Monitor...")
         from enhanced_wifi_monitor import EnhancedWiFiMonitor
-        
         monitor = EnhancedWiFiMonitor()
         print("✅ Enhanced WiFi Monitor loaded successfully")
         
@@ -50,9 +67,7 @@ def demo_enhanced_detection():
     try:
         # Demo secure network manager
         print("\n🌐 Testing Secure Network Manager...")
-        from secure_network_manager import SecureNetworkManager
-        
-        net_mgr = SecureNetworkManager()
+        net_mgr = net_mgr_future.result()
         print("✅ Secure Network Manager loaded successfully")
         
         # Test input validation
@@ -76,9 +91,7 @@ def demo_enhanced_detection():
     try:
         # Demo secure settings manager
         print("\n⚙️ Testing Secure Settings Manager...")
-        from secure_settings_manager import SecureSettingsManager
-        
-        settings_mgr = SecureSettingsManager("demo_settings.json", use_encryption=True)
+        settings_mgr = settings_future.result()
         print("✅ Secure Settings Manager loaded successfully")
         
         # Test validation
@@ -157,6 +170,8 @@ def demo_enhanced_detection():
 
 def demo_threat_scoring():
     """Demonstrate the enhanced threat scoring system"""
+    from enhanced_wifi_monitor import score_threat
+    
     print("\n🎯 THREAT SCORING DEMONSTRATION")
     print("=" * 40)
     
@@ -195,60 +210,56 @@ def demo_threat_scoring():
         print(f"\n📋 Scenario: {scenario['name']}")
         print("-" * 30)
         
-        score = 0
-        
         # Factor 1: Connection duration
         if scenario['connection_duration'] < 30:
-            score += 6
             print(f"⚠️  Very short connection ({scenario['connection_duration']}s): +6")
         elif scenario['connection_duration'] < 120:
-            score += 3
             print(f"⚠️  Short connection ({scenario['connection_duration']}s): +3")
         else:
             print(f"✅ Normal connection ({scenario['connection_duration']}s): +0")
         
         # Factor 2: Signal strength
         if scenario['signal_strength'] > 70:
-            score += 4
             print(f"⚠️  Strong signal disconnect ({scenario['signal_strength']}%): +4")
         elif scenario['signal_strength'] > 50:
-            score += 2
             print(f"⚠️  Good signal disconnect ({scenario['signal_strength']}%): +2")
         else:
             print(f"✅ Weak signal disconnect ({scenario['signal_strength']}%): +0")
         
         # Factor 3: Recent disconnects
         if scenario['recent_disconnects'] >= 3:
-            score += 8
             print(f"🚨 Many recent disconnects ({scenario['recent_disconnects']}): +8")
         elif scenario['recent_disconnects'] >= 2:
-            score += 5
             print(f"⚠️  Multiple recent disconnects ({scenario['recent_disconnects']}): +5")
         else:
             print(f"✅ Few recent disconnects ({scenario['recent_disconnects']}): +0")
         
         # Factor 4: Time-based patterns
         if scenario['time_of_day'] < 6 or scenario['time_of_day'] > 22:
-            score += 2
             print(f"⚠️  Suspicious time ({scenario['time_of_day']}:00): +2")
         else:
             print(f"✅ Normal time ({scenario['time_of_day']}:00): +0")
         
         # Factor 5: Signal drop
         if scenario['signal_drop']:
-            score += 6
             print(f"🚨 Recent signal drop detected: +6")
         else:
             print(f"✅ No signal drop: +0")
         
         # Factor 6: Same network targeting
         if scenario['same_network'] >= 2:
-            score += 5
             print(f"⚠️  Network targeted {scenario['same_network']} times: +5")
         else:
             print(f"✅ First targeting: +0")
         
-        final_score = min(score, 10)  # Cap at 10
+        final_score = score_threat(
+            scenario['connection_duration'],
+            scenario['signal_strength'],
+            scenario['recent_disconnects'],
+            scenario['time_of_day'],
+            scenario['signal_drop'],
+            scenario['same_network']
+        )
         
         print(f"\n📊 FINAL THREAT SCORE: {final_score}/10")
         
@@ -264,7 +275,8 @@ def demo_threat_scoring():
         print(f"🎯 Assessment: {threat_level}")
 
 
-if __name__ == "__main__":
+def main():
+    """Run the enhanced detection and threat scoring demos"""
     try:
         demo_enhanced_detection()
         demo_threat_scoring()
@@ -283,3 +295,7 @@ if __name__ == "__main__":
         print(f"\n❌ Demo error: {e}")
         import traceback
         traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
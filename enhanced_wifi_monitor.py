@@ -4,23 +4,403 @@ Enhanced Windows WiFi Connection Monitor v2.1
 Improved detection algorithms and security enhancements
 """
 
+import os
 import time
 import threading
 import subprocess
 import json
 import re
+import socket
 import hashlib
 import hmac
-from datetime import datetime, timedelta
-from PyQt5.QtCore import QObject, pyqtSignal
+from collections import OrderedDict, deque
+from functools import lru_cache
+from datetime import datetime
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
 import psutil
 import logging
+import wlan_api
+from secure_network_manager import NetshSession
+from array import array
 
 # Set up secure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# Per-factor points precomputed by raw value, so scoring is table lookups
+# instead of a chain of comparisons
+_DURATION_POINTS = tuple(6 if secs < 30 else 3 for secs in range(120))  # 120s+ scores 0
+_SIGNAL_POINTS = tuple(4 if pct > 70 else 2 if pct > 50 else 0 for pct in range(101))
+_RECENT_POINTS = (0, 0, 5, 8)  # 3+ recent disconnects score 8
+_HOUR_POINTS = tuple(2 if hour < 6 or hour > 22 else 0 for hour in range(24))
+
+_PERCENT_RE = re.compile(r'(\d+)%')
+_NUMBER_RE = re.compile(r'(\d+)')
+_SSID_CLEAN = re.compile(r'[^\w\s-]')
+
+
+@lru_cache(maxsize=256)
+def _safe_ssid(ssid):
+    """Strip an SSID to characters safe to pass to netsh, cached per SSID"""
+    return _SSID_CLEAN.sub('', ssid)[:32]  # Limit length and chars
+
+
+# Handlers for the netsh "Key : Value" lines the parsers read, keyed by the
+# exact key so each line costs one dict lookup
+def _set_state(status, value):
+    state = value.lower()
+    status['state'] = state
+    status['connected'] = state == 'connected'
+
+
+def _set_ssid(status, value):
+    if value and value != 'N/A':
+        status['ssid'] = value
+        status['safe_ssid'] = _safe_ssid(value)
+
+
+def _set_signal(status, value):
+    number = _PERCENT_RE.search(value)
+    if number:
+        status['signal'] = int(number.group(1))
+
+
+def _set_channel(status, value):
+    number = _NUMBER_RE.search(value)
+    if number:
+        status['channel'] = int(number.group(1))
+
+
+def _set_auth_type(status, value):
+    status['auth_type'] = value
+
+
+def _set_cipher(status, value):
+    status['cipher'] = value
+
+
+_INTERFACE_KEY_HANDLERS = {
+    'State': _set_state,
+    'SSID': _set_ssid,
+    'Signal': _set_signal,
+    'Channel': _set_channel,
+    'Authentication': _set_auth_type,
+    'Cipher': _set_cipher,
+}
+
+# Matches only the lines with a handler, in one pass over the netsh output
+_NETSH_INTERFACE_RE = re.compile(
+    r'^[ \t]*(?P<key>' + '|'.join(map(re.escape, _INTERFACE_KEY_HANDLERS)) +
+    r')[ \t]*:[ \t]*(?P<value>.*?)[ \t\r]*$',
+    re.MULTILINE
+)
+
+
+def _set_has_password(info, value):
+    info['has_password'] = 'Present' in value
+
+
+def _set_key_configured(info, value):
+    # Don't store actual password, just note if it exists
+    info['key_configured'] = bool(value and value != 'N/A')
+
+
+def _set_auto_connect(info, value):
+    info['auto_connect'] = value == 'Connect automatically'
+
+
+_PROFILE_KEY_HANDLERS = {
+    'Security key': _set_has_password,
+    'Key Content': _set_key_configured,
+    'Connection mode': _set_auto_connect,
+}
+
+# WLAN notifications that mean the connection state or signal has changed
+WAKE_NOTIFICATIONS = {
+    (wlan_api.NOTIFICATION_SOURCE_ACM, wlan_api.ACM_CONNECTION_COMPLETE),
+    (wlan_api.NOTIFICATION_SOURCE_ACM, wlan_api.ACM_DISCONNECTED),
+    (wlan_api.NOTIFICATION_SOURCE_MSM, wlan_api.MSM_SIGNAL_QUALITY_CHANGE),
+    (wlan_api.NOTIFICATION_SOURCE_MSM, wlan_api.MSM_DISCONNECTED),
+}
+PATTERN_ANALYSIS_INTERVAL = 15  # seconds
+
+# Adaptive netsh polling: back off while the link is stable, speed up after
+# a disconnect or signal drop
+POLL_INTERVAL = 1.0            # seconds
+FAST_POLL_INTERVAL = 0.25
+MAX_POLL_INTERVAL = 10.0
+POLL_BACKOFF = 1.5
+STABLE_POLLS_BEFORE_BACKOFF = 10
+FAST_POLL_WINDOW = 30          # seconds after a disconnect to keep polling fast
+SIGNAL_SAMPLE_HEARTBEAT = 10.0 # seconds between signal samples while the link is unchanged
+
+# Alerts raised on the monitor thread wait here until the GUI thread drains them
+ALERT_QUEUE_SIZE = 256
+ALERT_DRAIN_INTERVAL_MS = 200
+
+# Interface names that indicate a wireless adapter
+_WIFI_RE = re.compile(r'wifi|wireless|wlan|802\.11', re.IGNORECASE)
+
+# Profile security details rarely change, so they are looked up once per
+# network and reused instead of being re-queried on every poll
+PROFILE_CACHE_TTL = 300  # seconds
+PROFILE_CACHE_SIZE = 64
+
+# History bounds: an hour of 1 Hz signal samples and a day's worth of disconnects
+SIGNAL_HISTORY_SIZE = 3600
+DISCONNECT_HISTORY_SIZE = 2048
+
+# Threat scoring windows, kept as rolling counters rather than history scans
+RECENT_DISCONNECT_WINDOW = 5 * 60  # seconds
+SIGNAL_DROP_WINDOW = 2 * 60        # seconds
+
+
+def interval_regularity(times):
+    """
+    Return (mean interval, mean absolute deviation) of ascending times in seconds
+
+    The mean interval telescopes to (last - first) / intervals, so only the
+    deviation needs a loop, and it runs over plain floats.
+    """
+    intervals = len(times) - 1
+    if intervals < 1:
+        return 0.0, 0.0
+    
+    mean = (times[-1] - times[0]) / intervals
+    deviation = 0.0
+    previous = times[0]
+    for current in times[1:]:
+        deviation += abs(current - previous - mean)
+        previous = current
+    
+    return mean, deviation / intervals
+
+
+class SignalRing:
+    """Fixed-capacity ring buffer of signal samples stored as parallel arrays
+
+    Each sample costs a few bytes in typed arrays instead of a dict per poll.
+    Timestamps are time.monotonic() seconds, SSIDs are interned ids (0 for none) and
+    samples are kept in time order.
+    """
+    
+    def __init__(self, capacity=SIGNAL_HISTORY_SIZE):
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.signals = array('B', bytes(capacity))
+        self.channels = array('H', bytes(2 * capacity))
+        self.ssid_ids = array('H', bytes(2 * capacity))
+        self.head = 0  # Next slot to write
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def append(self, timestamp, ssid_id, signal, channel):
+        """Store a sample, overwriting the oldest one when full"""
+        i = self.head
+        self.timestamps[i] = timestamp
+        self.signals[i] = max(0, min(signal, 255))
+        self.channels[i] = max(0, min(channel, 65535))
+        self.ssid_ids[i] = ssid_id
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+    
+    def trim_before(self, cutoff):
+        """Drop samples at or before cutoff from the old end"""
+        while self.count and self.timestamps[(self.head - self.count) % self.capacity] <= cutoff:
+            self.count -= 1
+    
+    def _newest_first(self, cutoff=None, limit=None):
+        """Yield slot indices from newest to oldest, stopping at cutoff or limit"""
+        n = self.count if limit is None else min(limit, self.count)
+        for k in range(1, n + 1):
+            i = (self.head - k) % self.capacity
+            if cutoff is not None and self.timestamps[i] <= cutoff:
+                return
+            yield i
+    
+    def recent_signals(self, ssid_id, limit=None, cutoff=None):
+        """Signals for one SSID id among the newest samples, oldest first"""
+        values = [self.signals[i] for i in self._newest_first(cutoff, limit) if self.ssid_ids[i] == ssid_id]
+        values.reverse()
+        return values
+    
+    def signal_stats_by_ssid(self, cutoff):
+        """Return {ssid_id: (count, mean, variance)} for samples newer than cutoff
+
+        Uses Welford's online update, so mean and variance come out of the
+        same single walk over the window.
+        """
+        running = {}  # ssid_id -> [count, mean, M2]
+        for i in self._newest_first(cutoff):
+            ssid_id = self.ssid_ids[i]
+            if not ssid_id:
+                continue
+            stats = running.get(ssid_id)
+            if stats is None:
+                stats = running[ssid_id] = [0, 0.0, 0.0]
+            stats[0] += 1
+            delta = self.signals[i] - stats[1]
+            stats[1] += delta / stats[0]
+            stats[2] += delta * (self.signals[i] - stats[1])
+        return {ssid_id: (n, mean, m2 / n) for ssid_id, (n, mean, m2) in running.items()}
+
+
+class SignalSpread:
+    """Sliding-window sample count and max-min spread of one SSID's signal
+
+    Monotonic deques keep the window's extremes at their fronts, so every
+    sample is pushed and expired once and the spread reads in O(1).
+    """
+    
+    def __init__(self):
+        self.timestamps = deque()
+        self._maxima = deque()  # (timestamp, signal), signals decreasing
+        self._minima = deque()  # (timestamp, signal), signals increasing
+    
+    def __len__(self):
+        return len(self.timestamps)
+    
+    def append(self, timestamp, signal):
+        """Add a sample at the new end of the window"""
+        self.timestamps.append(timestamp)
+        while self._maxima and self._maxima[-1][1] <= signal:
+            self._maxima.pop()
+        self._maxima.append((timestamp, signal))
+        while self._minima and self._minima[-1][1] >= signal:
+            self._minima.pop()
+        self._minima.append((timestamp, signal))
+    
+    def expire(self, cutoff):
+        """Drop samples at or before cutoff from the old end"""
+        timestamps = self.timestamps
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        while self._maxima and self._maxima[0][0] <= cutoff:
+            self._maxima.popleft()
+        while self._minima and self._minima[0][0] <= cutoff:
+            self._minima.popleft()
+    
+    def spread(self):
+        """Return max - min signal over the window, 0 when empty"""
+        if not self.timestamps:
+            return 0
+        return self._maxima[0][1] - self._minima[0][1]
+
+
+class DisconnectRing:
+    """Fixed-capacity ring buffer of disconnect records stored as parallel arrays
+
+    Numeric fields live in typed arrays and repeated strings (auth types,
+    reasons) are interned, so a record costs a few dozen bytes instead of a
+    dict. Only the preformatted wall-clock label is kept as a str per record.
+    Timestamps are time.monotonic() seconds and records are kept in time order.
+    """
+    
+    def __init__(self, capacity=DISCONNECT_HISTORY_SIZE):
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.durations = array('d', bytes(8 * capacity))
+        self.ssid_ids = array('H', bytes(2 * capacity))
+        self.channels = array('H', bytes(2 * capacity))
+        self.auth_ids = array('H', bytes(2 * capacity))
+        self.reason_ids = array('H', bytes(2 * capacity))
+        self.signals = array('B', bytes(capacity))
+        self.threat_scores = array('B', bytes(capacity))
+        self.labels = [None] * capacity  # Display timestamps, formatted once
+        self.strings = []  # Interned auth types and reasons
+        self._string_ids = {}
+        self.head = 0  # Next slot to write
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def _intern(self, text):
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+    
+    def append(self, timestamp, label, ssid_id, signal, duration, channel,
+               auth_type, threat_score, reason):
+        """Store a record, overwriting the oldest one when full"""
+        i = self.head
+        self.timestamps[i] = timestamp
+        self.durations[i] = duration
+        self.ssid_ids[i] = ssid_id
+        self.channels[i] = max(0, min(channel, 65535))
+        self.auth_ids[i] = self._intern(auth_type)
+        self.reason_ids[i] = self._intern(reason)
+        self.signals[i] = max(0, min(signal, 255))
+        self.threat_scores[i] = threat_score
+        self.labels[i] = label
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+    
+    def pop(self):
+        """Drop the newest record"""
+        if not self.count:
+            raise IndexError("pop from an empty DisconnectRing")
+        self.head = (self.head - 1) % self.capacity
+        self.labels[self.head] = None
+        self.count -= 1
+    
+    def trim_before(self, cutoff):
+        """Drop records at or before cutoff from the old end"""
+        while self.count:
+            i = (self.head - self.count) % self.capacity
+            if self.timestamps[i] > cutoff:
+                break
+            self.labels[i] = None
+            self.count -= 1
+    
+    def newest_timestamp(self):
+        """Return the newest record's timestamp, or None when empty"""
+        return self.timestamps[(self.head - 1) % self.capacity] if self.count else None
+    
+    def newest_first(self, cutoff=None):
+        """Yield slot indices from newest to oldest, stopping at cutoff"""
+        for k in range(1, self.count + 1):
+            i = (self.head - k) % self.capacity
+            if cutoff is not None and self.timestamps[i] <= cutoff:
+                return
+            yield i
+
+
+def score_threat(connection_duration, signal_strength, recent_disconnects,
+                 hour, signal_drop, same_network):
+    """Score a disconnect from 0-10 using the six threat factors
+    
+    Pure function shared by the monitor and the demo so both use one kernel.
+    Duration is in whole seconds and signal in whole percent.
+    """
+    duration = int(connection_duration)
+    signal = min(max(int(signal_strength), 0), 100)
+    
+    score = (
+        # Factor 1: Connection duration (very short connections are suspicious)
+        (_DURATION_POINTS[duration] if 0 <= duration < 120 else 6 if duration < 0 else 0)
+        # Factor 2: Signal strength at disconnect
+        + _SIGNAL_POINTS[signal]
+        # Factor 3: Recent disconnect frequency
+        + _RECENT_POINTS[min(max(recent_disconnects, 0), 3)]
+        # Factor 4: Time-based patterns (late night attacks)
+        + _HOUR_POINTS[hour]
+        # Factor 5: Signal drop before disconnect
+        + (6 if signal_drop else 0)
+        # Factor 6: Repeated targeting of same network
+        + (5 if same_network >= 2 else 0)
+    )
+    
+    return min(score, 10)  # Cap at 10
+
+
 class EnhancedWiFiMonitor(QObject):
     """Enhanced WiFi monitor with sophisticated pattern detection"""
     
@@ -31,10 +411,31 @@ class EnhancedWiFiMonitor(QObject):
         super().__init__()
         self.is_monitoring = False
         self.monitor_thread = None
-        self.disconnect_history = []
-        self.signal_history = []
+        self._wlan = None  # Native WLAN API client, owned by the monitor thread
+        self._netsh_session = None  # Persistent netsh process when the WLAN API is unavailable
+        self._wlan_events = False  # True while WLAN notifications drive the loop
+        self._wake = threading.Event()
+        self._poll_interval = POLL_INTERVAL
+        self._stable_polls = 0
+        self._alert_queue = deque()  # Filled under _history_lock, emitted after it is released
+        self._dropped_alerts = 0
+        self._alert_timer = None
+        self._queue_alerts = False  # Only while a Qt event loop drains the queue
+        self._analysis_timer = None  # Runs pattern analysis on the Qt event loop
+        self.disconnect_history = DisconnectRing(DISCONNECT_HISTORY_SIZE)
+        self.signal_history = SignalRing(SIGNAL_HISTORY_SIZE)
         self.network_baselines = {}
-        self.last_check_time = datetime.now()
+        # SSIDs are interned so histories store and compare small ints
+        self._ssid_ids = {None: 0}
+        self._ssid_names = [None]
+        self._profile_cache = OrderedDict()  # profile -> (monotonic time, info)
+        self._rapid_window = deque()  # Monotonic times of disconnects in the rapid window
+        # Rolling inputs for threat scoring, updated as events arrive
+        self._recent_disconnects = deque()  # (monotonic time, ssid id), newest suffix of the history
+        self._recent_per_ssid = {}  # ssid id -> disconnects in _recent_disconnects
+        self._signal_spreads = {}  # ssid id -> SignalSpread over SIGNAL_DROP_WINDOW
+        # Histories are written by the monitor thread and analysed on the GUI thread
+        self._history_lock = threading.Lock()
         
         # Enhanced detection parameters
         self.rapid_disconnect_threshold = 3      # Max disconnects per minute
@@ -69,6 +470,7 @@ class EnhancedWiFiMonitor(QObject):
         """Start enhanced monitoring"""
         if not self.is_monitoring:
             self.is_monitoring = True
+            self._start_timers()
             self.monitor_thread = threading.Thread(target=self._enhanced_monitor_loop, daemon=True)
             self.monitor_thread.start()
             logger.info("Enhanced WiFi monitoring started")
@@ -76,37 +478,165 @@ class EnhancedWiFiMonitor(QObject):
     def stop_monitoring(self):
         """Stop monitoring"""
         self.is_monitoring = False
+        self._wake.set()
+        if self._analysis_timer is not None:
+            self._analysis_timer.stop()
+        if self._alert_timer is not None:
+            self._alert_timer.stop()
+            self._queue_alerts = False
+            self._drain_alerts()
         logger.info("Enhanced WiFi monitoring stopped")
+    
+    def _start_timers(self):
+        """Run alert draining and pattern analysis from the Qt event loop, if there is one"""
+        if QCoreApplication.instance() is None:
+            return
+        if self._alert_timer is None:
+            self._alert_timer = QTimer(self)
+            self._alert_timer.setInterval(ALERT_DRAIN_INTERVAL_MS)
+            self._alert_timer.timeout.connect(self._drain_alerts)
+            self._analysis_timer = QTimer(self)
+            self._analysis_timer.setInterval(PATTERN_ANALYSIS_INTERVAL * 1000)
+            self._analysis_timer.timeout.connect(self._enhanced_pattern_analysis)
+        self._queue_alerts = True
+        self._alert_timer.start()
+        self._analysis_timer.start()
+    
+    def _drain_alerts(self):
+        """Emit every queued alert; never call this with _history_lock held"""
+        with self._history_lock:
+            dropped, self._dropped_alerts = self._dropped_alerts, 0
+        if dropped:
+            logger.warning(f"Dropped {dropped} security alerts while the alert queue was full")
+        
+        queue = self._alert_queue
+        while True:
+            try:
+                alert = queue.popleft()
+            except IndexError:
+                break
+            self.suspicious_disconnect.emit(*alert)
         
     def _enhanced_monitor_loop(self):
         """Enhanced monitoring loop with comprehensive analysis"""
+        wlan = self._wlan = wlan_api.open_client()
+        self._wlan_events = False
+        if wlan is not None:
+            try:
+                wlan.register_notifications(self._on_wlan_notification)
+                self._wlan_events = True
+            except OSError as e:
+                logger.info(f"WLAN notifications unavailable, polling instead: {e}")
+        elif os.name == 'nt':
+            # Keep one netsh process for the polls instead of spawning one each
+            self._netsh_session = NetshSession()
+        
+        try:
+            self._run_monitor_loop()
+        finally:
+            if wlan is not None:
+                wlan.close()
+            if self._netsh_session is not None:
+                self._netsh_session.close()
+                self._netsh_session = None
+            if self._wlan is wlan:
+                self._wlan = None
+                self._wlan_events = False
+    
+    def _on_wlan_notification(self, source, code):
+        """Wake the monitor thread when the connection or signal changes"""
+        if (source, code) in WAKE_NOTIFICATIONS:
+            self._wake.set()
+    
+    def _wait_for_change(self):
+        """Block until the next status check is due"""
+        if self._wlan_events:
+            # Event driven: sleep until notified, also waking for pattern
+            # analysis when no Qt timer is running it
+            self._wake.wait(None if self._analysis_timer is not None else PATTERN_ANALYSIS_INTERVAL)
+            self._wake.clear()
+        else:
+            self._wake.wait(self._poll_interval)
+            self._wake.clear()
+    
+    def _adjust_poll_interval(self, unchanged, signal_drop, now):
+        """Pick the next polling interval from how settled the connection is"""
+        last_disconnect = self.disconnect_history.newest_timestamp()
+        recently_disconnected = last_disconnect is not None and now - last_disconnect < FAST_POLL_WINDOW
+        
+        if recently_disconnected or signal_drop:
+            self._poll_interval = FAST_POLL_INTERVAL
+            self._stable_polls = 0
+        elif unchanged:
+            self._stable_polls += 1
+            if self._stable_polls >= STABLE_POLLS_BEFORE_BACKOFF:
+                self._poll_interval = min(self._poll_interval * POLL_BACKOFF, MAX_POLL_INTERVAL)
+        else:
+            self._poll_interval = POLL_INTERVAL
+            self._stable_polls = 0
+    
+    def _sid(self, ssid):
+        """Return the interned id for an SSID, assigning one on first sight"""
+        ssid_id = self._ssid_ids.get(ssid)
+        if ssid_id is None:
+            ssid_id = self._ssid_ids[ssid] = len(self._ssid_names)
+            self._ssid_names.append(ssid)
+        return ssid_id
+    
+    @staticmethod
+    def _status_key(status):
+        """Fields that identify a change in connection state, signal in 5% steps"""
+        return (status.get('state'), status.get('ssid'), (status.get('signal') or 0) // 5, status.get('channel'))
+    
+    def _run_monitor_loop(self):
+        """Poll WiFi status until monitoring is stopped"""
         last_status = self._get_enhanced_wifi_status()
-        connection_start_time = datetime.now() if last_status.get('connected') else None
+        last_key = self._status_key(last_status)
+        now = time.monotonic()
+        connection_start_time = now if last_status.get('connected') else None
+        next_analysis = now + PATTERN_ANALYSIS_INTERVAL
+        last_sample = now - SIGNAL_SAMPLE_HEARTBEAT
         
         while self.is_monitoring:
             try:
-                time.sleep(1)  # More frequent checking for better detection
+                self._wait_for_change()
+                if not self.is_monitoring:
+                    break
                 current_status = self._get_enhanced_wifi_status()
+                now = time.monotonic()  # One clock read per iteration, shared below
+                key = self._status_key(current_status)
+                unchanged = key == last_key
+                signal_drop = self._had_recent_signal_drop(current_status.get('ssid'), now=now)
                 
-                # Track signal strength changes
-                if current_status.get('connected'):
-                    self._track_signal_changes(current_status)
+                # An unchanged link outside a signal drop only needs a periodic sample
+                if not unchanged or signal_drop or now - last_sample >= SIGNAL_SAMPLE_HEARTBEAT:
+                    with self._history_lock:
+                        # Track signal strength changes
+                        if current_status.get('connected'):
+                            self._track_signal_changes(current_status, now)
+                            last_sample = now
+                        
+                        # Detect disconnect events with context
+                        if last_status.get('connected') and not current_status.get('connected'):
+                            connection_duration = now - connection_start_time if connection_start_time is not None else 0
+                            self._handle_enhanced_disconnect(current_status, last_status, connection_duration, now)
+                            connection_start_time = None
+                        elif current_status.get('connected') and not last_status.get('connected'):
+                            # New connection established
+                            connection_start_time = now
+                    
+                    # Without a Qt event loop, emit here once the lock is released
+                    if not self._queue_alerts:
+                        self._drain_alerts()
                 
-                # Detect disconnect events with context
-                if last_status.get('connected') and not current_status.get('connected'):
-                    connection_duration = (datetime.now() - connection_start_time).total_seconds() if connection_start_time else 0
-                    self._handle_enhanced_disconnect(current_status, last_status, connection_duration)
-                    connection_start_time = None
-                elif current_status.get('connected') and not last_status.get('connected'):
-                    # New connection established
-                    connection_start_time = datetime.now()
-                
-                # Periodic pattern analysis
-                if (datetime.now() - self.last_check_time).seconds >= 15:  # More frequent analysis
+                # Periodic pattern analysis when no Qt timer is driving it
+                if self._analysis_timer is None and now >= next_analysis:
                     self._enhanced_pattern_analysis()
-                    self.last_check_time = datetime.now()
+                    next_analysis = now + PATTERN_ANALYSIS_INTERVAL
                 
+                self._adjust_poll_interval(unchanged, signal_drop, now)
                 last_status = current_status
+                last_key = key
                 
             except Exception as e:
                 logger.error(f"Error in enhanced monitoring loop: {e}")
@@ -114,22 +644,23 @@ class EnhancedWiFiMonitor(QObject):
                 
     def _get_enhanced_wifi_status(self):
         """Enhanced WiFi status with additional security context"""
+        status = self._get_wlan_api_status()
+        if status is not None:
+            return status
+        
         try:
             # Get WiFi interface status with security info
-            result = subprocess.run(
-                ['netsh', 'wlan', 'show', 'interfaces'],
-                capture_output=True, text=True, timeout=10
-            )
+            output = self._run_netsh(['wlan', 'show', 'interfaces'], timeout=10)
             
-            if result.returncode != 0:
+            if output is None:
                 return self._get_default_status()
             
-            status = self._parse_enhanced_interface_info(result.stdout)
+            status = self._parse_enhanced_interface_info(output)
             
             # Add additional network context
             if status['connected']:
                 # Get detailed profile information
-                profile_info = self._get_profile_security_info(status.get('ssid'))
+                profile_info = self._get_profile_security_info(status.get('ssid'), status.get('safe_ssid'))
                 status.update(profile_info)
                 
             return status
@@ -141,74 +672,96 @@ class EnhancedWiFiMonitor(QObject):
             logger.error(f"Error getting enhanced WiFi status: {e}")
             return self._get_default_status()
     
+    def _run_netsh(self, args, timeout):
+        """Run a netsh query through the persistent session, or a one-off process"""
+        session = self._netsh_session
+        if session is not None:
+            output = session.run(' '.join(args), timeout)
+            if output is not None:
+                return output
+        
+        result = subprocess.run(['netsh'] + args, capture_output=True, text=True, timeout=timeout)
+        return result.stdout if result.returncode == 0 else None
+    
+    def _get_wlan_api_status(self):
+        """Read WiFi status from wlanapi.dll, or None to fall back to netsh"""
+        wlan = self._wlan
+        if wlan is None:
+            return None
+        
+        try:
+            api_status = wlan.get_status()
+            if api_status is None:
+                return None
+            
+            status = self._get_default_status()
+            status.update(api_status)
+            if status['connected']:
+                status.update(self._get_profile_security_info(status.get('profile') or status.get('ssid')))
+            return status
+            
+        except OSError as e:
+            logger.warning(f"WLAN API query failed, using netsh: {e}")
+            return None
+    
     def _parse_enhanced_interface_info(self, output):
         """Parse netsh output with enhanced information extraction"""
         status = self._get_default_status()
         
-        lines = output.split('\n')
-        for line in lines:
-            line = line.strip()
+        for match in _NETSH_INTERFACE_RE.finditer(output):
+            key, value = match.group('key', 'value')
             try:
-                if 'State' in line and ':' in line:
-                    state = line.split(':', 1)[1].strip().lower()
-                    status['state'] = state
-                    status['connected'] = state == 'connected'
-                elif 'SSID' in line and ':' in line:
-                    ssid = line.split(':', 1)[1].strip()
-                    if ssid and ssid not in ['N/A', '']:
-                        status['ssid'] = ssid
-                elif 'Signal' in line and ':' in line:
-                    signal_text = line.split(':', 1)[1].strip()
-                    match = re.search(r'(\d+)%', signal_text)
-                    if match:
-                        status['signal'] = int(match.group(1))
-                elif 'Channel' in line and ':' in line:
-                    channel_text = line.split(':', 1)[1].strip()
-                    match = re.search(r'(\d+)', channel_text)
-                    if match:
-                        status['channel'] = int(match.group(1))
-                elif 'Authentication' in line and ':' in line:
-                    status['auth_type'] = line.split(':', 1)[1].strip()
-                elif 'Cipher' in line and ':' in line:
-                    status['cipher'] = line.split(':', 1)[1].strip()
-            except (IndexError, ValueError) as e:
-                logger.debug(f"Error parsing line '{line}': {e}")
+                _INTERFACE_KEY_HANDLERS[key](status, value)
+            except ValueError as e:
+                logger.debug(f"Error parsing line '{match.group(0)}': {e}")
                 continue
         
         return status
     
-    def _get_profile_security_info(self, ssid):
-        """Get security information for a specific network profile"""
+    def _get_profile_security_info(self, ssid, safe_ssid=None):
+        """Get security information for a specific network profile, cached per profile"""
+        if not ssid:
+            return {}
+        
+        now = time.monotonic()
+        cached = self._profile_cache.get(ssid)
+        if cached and now - cached[0] < PROFILE_CACHE_TTL:
+            self._profile_cache.move_to_end(ssid)
+            return cached[1]
+        
+        wlan = self._wlan
+        if wlan is not None:
+            profile_info = wlan.get_profile_info(ssid)
+        else:
+            profile_info = self._query_profile_security_info(ssid, safe_ssid or _safe_ssid(ssid))
+        
+        # Failed lookups return {} and are retried on the next poll
+        if profile_info:
+            self._profile_cache[ssid] = (now, profile_info)
+            self._profile_cache.move_to_end(ssid)
+            if len(self._profile_cache) > PROFILE_CACHE_SIZE:
+                self._profile_cache.popitem(last=False)
+        
+        return profile_info
+    
+    def _query_profile_security_info(self, ssid, safe_ssid):
+        """Query netsh for the security information of a network profile
+
+        safe_ssid is the SSID already sanitized by _safe_ssid, which keeps
+        command injection characters out of the netsh arguments.
+        """
         try:
-            if not ssid:
-                return {}
-                
-            # Sanitize SSID to prevent command injection
-            safe_ssid = re.sub(r'[^\w\s-]', '', ssid)[:32]  # Limit length and chars
-            
-            result = subprocess.run(
-                ['netsh', 'wlan', 'show', 'profile', f'name="{safe_ssid}"', 'key=clear'],
-                capture_output=True, text=True, timeout=5
-            )
+            output = self._run_netsh(['wlan', 'show', 'profile', f'name="{safe_ssid}"', 'key=clear'], timeout=5)
             
-            if result.returncode != 0:
+            if output is None:
                 return {}
             
             profile_info = {}
-            lines = result.stdout.split('\n')
-            for line in lines:
-                line = line.strip()
-                try:
-                    if 'Security key' in line and ':' in line:
-                        profile_info['has_password'] = 'Present' in line
-                    elif 'Key Content' in line and ':' in line:
-                        # Don't store actual password, just note if it exists
-                        key_content = line.split(':', 1)[1].strip()
-                        profile_info['key_configured'] = bool(key_content and key_content != 'N/A')
-                    elif 'Connect automatically' in line and ':' in line:
-                        profile_info['auto_connect'] = 'Yes' in line
-                except (IndexError, ValueError):
-                    continue
+            for line in output.splitlines():
+                key, _, value = line.partition(':')
+                handler = _PROFILE_KEY_HANDLERS.get(key.strip())
+                if handler:
+                    handler(profile_info, value.strip())
             
             return profile_info
             
@@ -224,6 +777,7 @@ class EnhancedWiFiMonitor(QObject):
         return {
             'connected': False,
             'ssid': None,
+            'safe_ssid': None,
             'signal': 0,
             'state': 'disconnected',
             'channel': 0,
@@ -232,58 +786,74 @@ class EnhancedWiFiMonitor(QObject):
             'timestamp': datetime.now()
         }
     
-    def _track_signal_changes(self, current_status):
+    def _track_signal_changes(self, current_status, now=None):
         """Track signal strength changes for anomaly detection"""
         if not current_status.get('connected') or current_status.get('signal', 0) == 0:
             return
         
-        signal_entry = {
-            'timestamp': datetime.now(),
-            'ssid': current_status.get('ssid'),
-            'signal': current_status.get('signal'),
-            'channel': current_status.get('channel', 0)
-        }
-        
-        self.signal_history.append(signal_entry)
+        if now is None:
+            now = time.monotonic()
+        ssid_id = self._sid(current_status.get('ssid'))
+        signal = current_status.get('signal')
+        self.signal_history.append(now, ssid_id, signal, current_status.get('channel', 0))
         
         # Keep only recent signal history (last hour)
-        cutoff_time = datetime.now() - timedelta(hours=1)
-        self.signal_history = [s for s in self.signal_history if s['timestamp'] > cutoff_time]
+        self.signal_history.trim_before(now - 3600)
+        
+        spread = self._signal_spreads.get(ssid_id)
+        if spread is None:
+            spread = self._signal_spreads[ssid_id] = SignalSpread()
+        spread.append(now, signal)
+        spread.expire(now - SIGNAL_DROP_WINDOW)
         
         # Check for sudden signal drops
-        self._detect_signal_anomalies(signal_entry)
+        self._detect_signal_anomalies(ssid_id, signal)
     
-    def _detect_signal_anomalies(self, current_signal):
+    def _detect_signal_anomalies(self, ssid_id, current):
         """Detect suspicious signal strength patterns"""
         if len(self.signal_history) < 10:  # Need enough history
             return
         
-        ssid = current_signal['ssid']
-        recent_signals = [s['signal'] for s in self.signal_history[-10:] if s['ssid'] == ssid]
+        recent_signals = self.signal_history.recent_signals(ssid_id, limit=10)
         
         if len(recent_signals) < 5:
             return
         
         # Calculate signal baseline
         avg_signal = sum(recent_signals[:-1]) / len(recent_signals[:-1])
-        current = current_signal['signal']
         
         # Detect sudden drops that might indicate jamming
         signal_drop = avg_signal - current
         if signal_drop > self.signal_drop_threshold and avg_signal > 50:
-            logger.warning(f"Suspicious signal drop detected: {signal_drop}% on {ssid}")
+            logger.warning(f"Suspicious signal drop detected: {signal_drop}% on {self._ssid_names[ssid_id]}")
             # This will be used in disconnect analysis if disconnect follows
     
-    def _handle_enhanced_disconnect(self, current_status, last_status, connection_duration):
+    def _handle_enhanced_disconnect(self, current_status, last_status, connection_duration, now=None):
         """Enhanced disconnect handling with threat assessment"""
-        timestamp = datetime.now()
+        if now is None:
+            now = time.monotonic()
+        wall_time = datetime.now()  # Only for display and the time-of-day factor
+        
+        ssid = last_status.get('ssid')
+        ssid_id = self._sid(ssid)
+        recent_count, same_network = self._recent_disconnect_counts(ssid_id, now)
         
         # Calculate threat score based on multiple factors
-        threat_score = self._calculate_threat_score(current_status, last_status, connection_duration)
+        threat_score = self._calculate_threat_score(
+            connection_duration,
+            last_status.get('signal', 0),
+            recent_count,
+            same_network,
+            self._had_recent_signal_drop(ssid, now=now),
+            wall_time.hour
+        )
         
         disconnect_info = {
-            'timestamp': timestamp,
+            'timestamp': now,
+            # Formatted once here so get_recent_events doesn't strftime per call
+            'timestamp_str': wall_time.isoformat(sep=' ', timespec='seconds'),
             'ssid': last_status.get('ssid', 'Unknown'),
+            'ssid_id': ssid_id,
             'last_signal': last_status.get('signal', 0),
             'connection_duration': connection_duration,
             'channel': last_status.get('channel', 0),
@@ -292,61 +862,63 @@ class EnhancedWiFiMonitor(QObject):
             'disconnect_reason': self._infer_disconnect_reason(current_status, last_status)
         }
         
-        self.disconnect_history.append(disconnect_info)
+        self.disconnect_history.append(
+            now, disconnect_info['timestamp_str'], ssid_id, disconnect_info['last_signal'],
+            connection_duration, disconnect_info['channel'], disconnect_info['auth_type'],
+            threat_score, disconnect_info['disconnect_reason']
+        )
+        self._recent_disconnects.append((now, ssid_id))
+        self._recent_per_ssid[ssid_id] = self._recent_per_ssid.get(ssid_id, 0) + 1
         
         # Maintain history within memory limit
-        cutoff_time = timestamp - timedelta(hours=self.pattern_memory_hours)
-        self.disconnect_history = [d for d in self.disconnect_history if d['timestamp'] > cutoff_time]
+        self.disconnect_history.trim_before(now - self.pattern_memory_hours * 3600)
         
         logger.info(f"WiFi disconnect detected: {disconnect_info}")
         
         # Immediate threat assessment
         if threat_score >= 7:  # High threat threshold
+            # Re-read the profile on reconnect in case it was tampered with
+            self._profile_cache.pop(last_status.get('profile') or last_status.get('ssid'), None)
             self._emit_security_alert(disconnect_info, "High-risk disconnect pattern")
         elif connection_duration < self.minimum_connection_time and threat_score >= 5:
             self._emit_security_alert(disconnect_info, "Rapid disconnect after brief connection")
-    
-    def _calculate_threat_score(self, current_status, last_status, connection_duration):
-        """Calculate threat score based on multiple indicators"""
-        score = 0
-        
-        # Factor 1: Connection duration (very short connections are suspicious)
-        if connection_duration < 30:
-            score += 6
-        elif connection_duration < 120:
-            score += 3
         
-        # Factor 2: Signal strength at disconnect
-        last_signal = last_status.get('signal', 0)
-        if last_signal > 70:  # Strong signal disconnect is suspicious
-            score += 4
-        elif last_signal > 50:
-            score += 2
-        
-        # Factor 3: Recent disconnect frequency
-        recent_disconnects = self._get_recent_disconnects(minutes=5)
-        if len(recent_disconnects) >= 3:
-            score += 8  # Very suspicious
-        elif len(recent_disconnects) >= 2:
-            score += 5
-        
-        # Factor 4: Time-based patterns (attacks often at specific times)
-        current_hour = datetime.now().hour
-        if current_hour < 6 or current_hour > 22:  # Late night attacks
-            score += 2
+        self._update_rapid_window(now)
+    
+    def _update_rapid_window(self, now):
+        """Slide the rapid-disconnect window forward and check it for a burst"""
+        window = self._rapid_window
+        window.append(now)
         
-        # Factor 5: Signal drop before disconnect
-        if self._had_recent_signal_drop(last_status.get('ssid')):
-            score += 6
+        cutoff = now - self.suspicious_window_minutes * 60
+        while window and window[0] <= cutoff:
+            window.popleft()
         
-        # Factor 6: Repeated targeting of same network
-        ssid = last_status.get('ssid')
-        if ssid:
-            recent_same_network = [d for d in recent_disconnects if d.get('ssid') == ssid]
-            if len(recent_same_network) >= 2:
-                score += 5
+        if self._analyze_rapid_disconnects(len(window)):
+            window.clear()
+    
+    def _calculate_threat_score(self, connection_duration, last_signal, recent_count,
+                                same_network, had_drop, hour):
+        """Calculate threat score from precomputed indicators"""
+        return score_threat(connection_duration, last_signal, recent_count, hour, had_drop, same_network)
+    
+    def _recent_disconnect_counts(self, ssid_id, now):
+        """Return (all, same SSID) disconnect counts in the recent window"""
+        recent = self._recent_disconnects
+        per_ssid = self._recent_per_ssid
+        cutoff = now - RECENT_DISCONNECT_WINDOW
+        while recent and recent[0][0] <= cutoff:
+            self._forget_recent(recent.popleft()[1])
         
-        return min(score, 10)  # Cap at 10
+        return len(recent), per_ssid.get(ssid_id, 0) if ssid_id else 0
+    
+    def _forget_recent(self, ssid_id):
+        """Decrement an SSID's recent disconnect count"""
+        count = self._recent_per_ssid[ssid_id] - 1
+        if count:
+            self._recent_per_ssid[ssid_id] = count
+        else:
+            del self._recent_per_ssid[ssid_id]
     
     def _infer_disconnect_reason(self, current_status, last_status):
         """Infer likely reason for disconnect"""
@@ -360,112 +932,105 @@ class EnhancedWiFiMonitor(QObject):
         else:
             return "Normal signal disconnect"
     
-    def _get_recent_disconnects(self, minutes=5):
-        """Get disconnects within specified time window"""
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        return [d for d in self.disconnect_history if d['timestamp'] > cutoff_time]
-    
-    def _had_recent_signal_drop(self, ssid, minutes=2):
+    def _had_recent_signal_drop(self, ssid, now=None):
         """Check if there was a recent significant signal drop for this SSID"""
-        if not ssid:
+        ssid_id = self._ssid_ids.get(ssid) if ssid else None
+        spread = self._signal_spreads.get(ssid_id) if ssid_id else None
+        if spread is None:
             return False
         
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        recent_signals = [s for s in self.signal_history if s['timestamp'] > cutoff_time and s['ssid'] == ssid]
-        
-        if len(recent_signals) < 5:
+        spread.expire((time.monotonic() if now is None else now) - SIGNAL_DROP_WINDOW)
+        if len(spread) < 5:
             return False
         
         # Check for significant drop in recent history
-        signals = [s['signal'] for s in recent_signals]
-        max_signal = max(signals)
-        min_signal = min(signals)
-        
-        return (max_signal - min_signal) > self.signal_drop_threshold
+        return spread.spread() > self.signal_drop_threshold
     
     def _enhanced_pattern_analysis(self):
         """Enhanced pattern analysis with machine learning concepts"""
+        with self._history_lock:
+            self._analyze_patterns()
+        if not self._queue_alerts:
+            self._drain_alerts()
+    
+    def _analyze_patterns(self):
+        """Run every pattern analysis over the current histories"""
         if len(self.disconnect_history) < 2:
             return
         
-        now = datetime.now()
+        now = time.monotonic()
+        targeting_cutoff = now - 3600
+        temporal_cutoff = now - 2 * 3600
+        oldest_cutoff = min(targeting_cutoff, temporal_cutoff)
         
-        # Analysis 1: Rapid sequential disconnects
-        self._analyze_rapid_disconnects(now)
+        # Single walk back through the history, filling every window at once.
+        # Rapid disconnects are counted incrementally by _update_rapid_window.
+        history = self.disconnect_history
+        timestamps = []   # Temporal window, newest first
+        ssid_counts = {}  # Targeting window, by SSID id
+        for i in history.newest_first(oldest_cutoff):
+            timestamp = history.timestamps[i]
+            if timestamp > temporal_cutoff:
+                timestamps.append(timestamp)
+            if timestamp > targeting_cutoff:
+                ssid_id = history.ssid_ids[i]
+                if ssid_id:
+                    ssid_counts[ssid_id] = ssid_counts.get(ssid_id, 0) + 1
         
-        # Analysis 2: Temporal attack patterns
-        self._analyze_temporal_patterns(now)
+        # Analysis 1: Temporal attack patterns
+        timestamps.reverse()
+        self._analyze_temporal_patterns(timestamps)
         
-        # Analysis 3: Network targeting patterns
-        self._analyze_network_targeting(now)
+        # Analysis 2: Network targeting patterns
+        self._analyze_network_targeting(ssid_counts)
         
-        # Analysis 4: Signal-based attack indicators
+        # Analysis 3: Signal-based attack indicators
         self._analyze_signal_based_attacks(now)
     
-    def _analyze_rapid_disconnects(self, now):
-        """Analyze for rapid disconnect patterns"""
-        recent_window = now - timedelta(minutes=self.suspicious_window_minutes)
-        recent_disconnects = [d for d in self.disconnect_history if d['timestamp'] > recent_window]
+    def _analyze_rapid_disconnects(self, recent_count):
+        """Analyze for rapid disconnect patterns, returning True if an alert was raised"""
+        if recent_count < self.rapid_disconnect_threshold:
+            return False
         
-        if len(recent_disconnects) >= self.rapid_disconnect_threshold:
-            threat_score = min(len(recent_disconnects) * 2, 10)
-            details = f"{len(recent_disconnects)} disconnects in {self.suspicious_window_minutes} minutes"
-            
-            self._emit_security_alert({
-                'timestamp': now,
-                'threat_score': threat_score,
-                'pattern': 'rapid_disconnect',
-                'details': details
-            }, "Rapid disconnect pattern detected")
-            
-            # Clear to prevent duplicate alerts
-            self.disconnect_history = [d for d in self.disconnect_history if d['timestamp'] <= recent_window]
+        threat_score = min(recent_count * 2, 10)
+        details = f"{recent_count} disconnects in {self.suspicious_window_minutes} minutes"
+        
+        self._emit_security_alert({
+            'threat_score': threat_score,
+            'pattern': 'rapid_disconnect',
+            'details': details
+        }, "Rapid disconnect pattern detected")
+        
+        # Clear to prevent duplicate alerts
+        recent = self._recent_disconnects
+        for _ in range(recent_count):
+            self.disconnect_history.pop()
+            if recent:
+                self._forget_recent(recent.pop()[1])
+        return True
     
-    def _analyze_temporal_patterns(self, now):
+    def _analyze_temporal_patterns(self, timestamps):
         """Analyze temporal patterns that might indicate coordinated attacks"""
         # Look for disconnects at regular intervals (possible automated attacks)
-        recent_hours = now - timedelta(hours=2)
-        recent_disconnects = [d for d in self.disconnect_history if d['timestamp'] > recent_hours]
-        
-        if len(recent_disconnects) >= 4:
-            # Calculate intervals between disconnects
-            intervals = []
-            for i in range(1, len(recent_disconnects)):
-                interval = (recent_disconnects[i]['timestamp'] - recent_disconnects[i-1]['timestamp']).total_seconds()
-                intervals.append(interval)
-            
+        if len(timestamps) >= 4:
             # Check for regular patterns (automated attacks often have consistent timing)
-            if len(intervals) >= 3:
-                avg_interval = sum(intervals) / len(intervals)
-                deviations = [abs(interval - avg_interval) for interval in intervals]
-                avg_deviation = sum(deviations) / len(deviations)
-                
-                # If intervals are very regular, it might be automated
-                if avg_deviation < 30 and avg_interval < 600:  # Less than 30s deviation, intervals under 10 min
-                    self._emit_security_alert({
-                        'timestamp': now,
-                        'threat_score': 8,
-                        'pattern': 'temporal_regularity',
-                        'details': f"Regular disconnect pattern every {avg_interval:.0f}s"
-                    }, "Automated attack pattern detected")
+            avg_interval, avg_deviation = interval_regularity(timestamps)
+            
+            # If intervals are very regular, it might be automated
+            if avg_deviation < 30 and avg_interval < 600:  # Less than 30s deviation, intervals under 10 min
+                self._emit_security_alert({
+                    'threat_score': 8,
+                    'pattern': 'temporal_regularity',
+                    'details': f"Regular disconnect pattern every {avg_interval:.0f}s"
+                }, "Automated attack pattern detected")
     
-    def _analyze_network_targeting(self, now):
+    def _analyze_network_targeting(self, ssid_counts):
         """Analyze if specific networks are being repeatedly targeted"""
-        recent_hours = now - timedelta(hours=1)
-        recent_disconnects = [d for d in self.disconnect_history if d['timestamp'] > recent_hours]
-        
-        # Count disconnects per SSID
-        ssid_counts = {}
-        for disconnect in recent_disconnects:
-            ssid = disconnect.get('ssid')
-            if ssid and ssid != 'Unknown':
-                ssid_counts[ssid] = ssid_counts.get(ssid, 0) + 1
-        
         # Check for networks with excessive disconnects
-        for ssid, count in ssid_counts.items():
+        for ssid_id, count in ssid_counts.items():
             if count >= 3:  # 3+ disconnects from same network in 1 hour
+                ssid = self._ssid_names[ssid_id]
                 self._emit_security_alert({
-                    'timestamp': now,
                     'threat_score': 7,
                     'pattern': 'network_targeting',
                     'details': f"Network '{ssid}' targeted {count} times in 1 hour"
@@ -473,48 +1038,24 @@ class EnhancedWiFiMonitor(QObject):
     
     def _analyze_signal_based_attacks(self, now):
         """Analyze signal patterns that might indicate jamming or similar attacks"""
-        recent_minutes = now - timedelta(minutes=10)
-        recent_signals = [s for s in self.signal_history if s['timestamp'] > recent_minutes]
-        
-        if len(recent_signals) < 10:
-            return
-        
         # Look for unusual signal patterns
-        signals_by_ssid = {}
-        for signal_entry in recent_signals:
-            ssid = signal_entry['ssid']
-            if ssid:
-                if ssid not in signals_by_ssid:
-                    signals_by_ssid[ssid] = []
-                signals_by_ssid[ssid].append(signal_entry['signal'])
-        
-        for ssid, signals in signals_by_ssid.items():
-            if len(signals) >= 10:
+        signal_stats = self.signal_history.signal_stats_by_ssid(now - 10 * 60)
+        
+        for ssid_id, (count, avg_signal, signal_variance) in signal_stats.items():
+            if count >= 10:
                 # Check for rapid signal fluctuations (possible jamming)
-                signal_variance = self._calculate_variance(signals)
-                avg_signal = sum(signals) / len(signals)
-                
                 # High variance with low average might indicate interference
                 if signal_variance > 400 and avg_signal < 50:
+                    ssid = self._ssid_names[ssid_id]
                     self._emit_security_alert({
-                        'timestamp': now,
                         'threat_score': 6,
                         'pattern': 'signal_interference',
                         'details': f"High signal variance ({signal_variance:.0f}) on {ssid}"
                     }, f"Signal interference detected on {ssid}")
     
-    def _calculate_variance(self, values):
-        """Calculate variance of a list of values"""
-        if len(values) < 2:
-            return 0
-        
-        mean = sum(values) / len(values)
-        squared_diffs = [(x - mean) ** 2 for x in values]
-        return sum(squared_diffs) / len(squared_diffs)
-    
     def _emit_security_alert(self, event_info, alert_reason):
         """Emit security alert with detailed information"""
-        timestamp = event_info.get('timestamp', datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = event_info.get('timestamp_str') or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         threat_score = event_info.get('threat_score', 5)
         
         # Format detailed alert information
@@ -524,37 +1065,44 @@ class EnhancedWiFiMonitor(QObject):
         
         logger.warning(f"Security alert: {alert_reason} - {details} (Threat: {threat_score}/10)")
         
-        # Emit signal for GUI
-        self.suspicious_disconnect.emit(alert_reason, timestamp, details)
+        # Callers hold _history_lock, so only queue here; the alert is emitted
+        # by _drain_alerts (Qt timer, or the caller once the lock is released)
+        # so slots may safely call back into get_recent_events
+        if len(self._alert_queue) >= ALERT_QUEUE_SIZE:
+            if not self._dropped_alerts:
+                logger.warning("Alert queue full, dropping new security alerts")
+            self._dropped_alerts += 1
+            return
+        self._alert_queue.append((alert_reason, timestamp, details))
     
     def get_recent_events(self):
         """Get recent events with enhanced information"""
-        cutoff_time = datetime.now() - timedelta(hours=1)
+        cutoff_time = time.monotonic() - 3600
+        history = self.disconnect_history
         events = []
         
-        for disconnect in self.disconnect_history:
-            if disconnect['timestamp'] > cutoff_time:
+        with self._history_lock:
+            for i in history.newest_first(cutoff_time):
                 events.append({
-                    'timestamp': disconnect['timestamp'].strftime("%Y-%m-%d %H:%M:%S"),
-                    'ssid': disconnect['ssid'],
-                    'threat_score': disconnect.get('threat_score', 0),
-                    'reason': disconnect.get('disconnect_reason', 'Unknown'),
-                    'duration': disconnect.get('connection_duration', 0)
+                    'timestamp': history.labels[i],
+                    'ssid': self._ssid_names[history.ssid_ids[i]],
+                    'threat_score': history.threat_scores[i],
+                    'reason': history.strings[history.reason_ids[i]],
+                    'duration': history.durations[i]
                 })
         
-        return sorted(events, key=lambda x: x['timestamp'], reverse=True)
+        return events
     
     def get_network_interfaces(self):
         """Get enhanced network interface information"""
         try:
             interfaces = []
-            for interface in psutil.net_if_stats():
-                stats = psutil.net_if_stats()[interface]
-                addresses = psutil.net_if_addrs().get(interface, [])
+            addrs_map = psutil.net_if_addrs()
+            for interface, stats in psutil.net_if_stats().items():
+                addresses = addrs_map.get(interface, [])
                 
                 # Enhanced WiFi detection
-                is_wifi = any(keyword in interface.lower() for keyword in 
-                             ['wifi', 'wireless', 'wlan', '802.11'])
+                is_wifi = _WIFI_RE.search(interface) is not None
                 
                 if is_wifi or stats.isup:
                     interfaces.append({
@@ -562,8 +1110,8 @@ class EnhancedWiFiMonitor(QObject):
                         'is_up': stats.isup,
                         'speed': stats.speed,
                         'is_wifi': is_wifi,
-                        'addresses': [addr.address for addr in addresses 
-                                    if hasattr(addr, 'family') and addr.family.name == 'AF_INET'],
+                        'addresses': [addr.address for addr in addresses
+                                      if addr.family == socket.AF_INET],
                         'mtu': stats.mtu if hasattr(stats, 'mtu') else 0
                     })
             
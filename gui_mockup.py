@@ -4,185 +4,259 @@ Visual GUI Mock-up for WiFi Deauth Detector
 Creates ASCII art representation of the application interface
 """
 
-def create_gui_mockup():
-    """Create ASCII art mockup of the GUI"""
-    
-    print("📱 WiFi Deauth Detector v1.0.0 - GUI Mockup")
-    print("=" * 80)
-    print()
-    
-    # Monitor Tab Mockup
-    print("🖥️  MONITOR TAB")
-    print("─" * 78)
-    print("┌────────────────────────────────────────────────────────────────────────────┐")
-    print("│                        WiFi Deauth Detector v1.0.0                        │")
-    print("├────────────────────────────────────────────────────────────────────────────┤")
-    print("│ [Monitor] [Settings] [Logs]                                                │")
-    print("├────────────────────────────────────────────────────────────────────────────┤")
-    print("│                                                                            │")
-    print("│ ┌─ Detection Status ─────────────────────────────────────────────────────┐ │")
-    print("│ │                                                                        │ │")
-    print("│ │  🟢 Monitoring Active                                                  │ │")
-    print("│ │                                                                        │ │")
-    print("│ │  [Start Monitoring] [Stop Monitoring] [Test Detection]                │ │")
-    print("│ │                                                                        │ │")
-    print("│ └────────────────────────────────────────────────────────────────────────┘ │")
-    print("│                                                                            │")
-    print("│ ┌─ Recent Alerts ────────────────────────────────────────────────────────┐ │")
-    print("│ │                                                                        │ │")
-    print("│ │ [2024-08-03 17:30:15] ATTACK! Attacker: 00:11:22:33:44:55             │ │")
-    print("│ │                               → Target: aa:bb:cc:dd:ee:ff              │ │")
-    print("│ │                                                                        │ │")
-    print("│ │ [2024-08-03 17:32:22] ATTACK! Attacker: 66:77:88:99:aa:bb             │ │")
-    print("│ │                               → Target: cc:dd:ee:ff:00:11              │ │")
-    print("│ │                                                                        │ │")
-    print("│ └────────────────────────────────────────────────────────────────────────┘ │")
-    print("│                                                                            │")
-    print("│ ┌─ Statistics ───────────────────────────────────────────────────────────┐ │")
-    print("│ │                                                                        │ │")
-    print("│ │ Total Attacks Detected: 2                                             │ │")
-    print("│ │ Last Attack: 2024-08-03 17:32:22                                      │ │")
-    print("│ │                                                                        │ │")
-    print("│ └────────────────────────────────────────────────────────────────────────┘ │")
-    print("│                                                                            │")
-    print("└────────────────────────────────────────────────────────────────────────────┘")
-    print()
-    
-    # Settings Tab Mockup
-    print("⚙️  SETTINGS TAB")
-    print("─" * 78)
-    print("┌────────────────────────────────────────────────────────────────────────────┐")
-    print("│                        WiFi Deauth Detector v1.0.0                        │")
-    print("├────────────────────────────────────────────────────────────────────────────┤")
-    print("│ [Monitor] [Settings] [Logs]                                                │")
-    print("├────────────────────────────────────────────────────────────────────────────┤")
-    print("│                                                                            │")
-    print("│ ┌─ Auto Network Switching ───────────────────────────────────────────────┐ │")
-    print("│ │                                                                        │ │")
-    print("│ │ ☑ Enable auto-switch on attack                                        │ │")
-    print("│ │ ☑ Confirm before switching                                            │ │")
-    print("│ │                                                                        │ │")
-    print("│ │ Backup Network: [BackupWiFi_5G        ▼] [Refresh Networks]           │ │")
-    print("│ │                                                                        │ │")
-    print("│ └────────────────────────────────────────────────────────────────────────┘ │")
-    print("│                                                                            │")
-    print("│ ┌─ Discord Webhook Alerts ───────────────────────────────────────────────┐ │")
-    print("│ │                                                                        │ │")
-    print("│ │ ☑ Enable Discord alerts                                               │ │")
-    print("│ │                                                                        │ │")
-    print("│ │ Webhook URL: [https://discord.com/api/webhooks/demo/url              ] │ │")
-    print("│ │                                                                        │ │")
-    print("│ │ [Test Webhook]                                                         │ │")
-    print("│ │                                                                        │ │")
-    print("│ └────────────────────────────────────────────────────────────────────────┘ │")
-    print("│                                                                            │")
-    print("│ ┌─ General Settings ─────────────────────────────────────────────────────┐ │")
-    print("│ │                                                                        │ │")
-    print("│ │ ☑ Enable system notifications                                         │ │")
-    print("│ │ ☑ Log attacks to file                                                 │ │")
-    print("│ │                                                                        │ │")
-    print("│ │ [Save Settings]                                                        │ │")
-    print("│ │                                                                        │ │")
-    print("│ └────────────────────────────────────────────────────────────────────────┘ │")
-    print("│                                                                            │")
-    print("└────────────────────────────────────────────────────────────────────────────┘")
-    print()
-    
-    # Logs Tab Mockup
-    print("📄 LOGS TAB")
-    print("─" * 78)
-    print("┌────────────────────────────────────────────────────────────────────────────┐")
-    print("│                        WiFi Deauth Detector v1.0.0                        │")
-    print("├────────────────────────────────────────────────────────────────────────────┤")
-    print("│ [Monitor] [Settings] [Logs]                                                │")
-    print("├────────────────────────────────────────────────────────────────────────────┤")
-    print("│                                                                            │")
-    print("│ ┌─ Event Log ────────────────────────────────────────────────────────────┐ │")
-    print("│ │                                                                        │ │")
-    print("│ │ [2024-08-03 17:29:45] Application started                             │ │")
-    print("│ │ [2024-08-03 17:29:46] Monitoring configuration loaded                 │ │")
-    print("│ │ [2024-08-03 17:29:47] Network profiles detected: 5                    │ │")
-    print("│ │ [2024-08-03 17:29:50] Monitoring started                              │ │")
-    print("│ │ [2024-08-03 17:30:15] DEAUTH ATTACK - Attacker: 00:11:22:33:44:55    │ │")
-    print("│ │                       → Target: aa:bb:cc:dd:ee:ff                     │ │")
-    print("│ │ [2024-08-03 17:30:17] Successfully switched to backup network:       │ │")
-    print("│ │                       BackupWiFi_5G                                   │ │")
-    print("│ │ [2024-08-03 17:32:22] DEAUTH ATTACK - Attacker: 66:77:88:99:aa:bb    │ │")
-    print("│ │                       → Target: cc:dd:ee:ff:00:11                     │ │")
-    print("│ │                                                                        │ │")
-    print("│ │ ▼ More logs...                                                         │ │")
-    print("│ │                                                                        │ │")
-    print("│ └────────────────────────────────────────────────────────────────────────┘ │")
-    print("│                                                                            │")
-    print("│ [Clear Logs] [Export Logs]                                                 │")
-    print("│                                                                            │")
-    print("└────────────────────────────────────────────────────────────────────────────┘")
-    print()
-    
-    # System Notification Mockup
-    print("🔔 SYSTEM NOTIFICATION")
-    print("─" * 78)
-    print("┌─ Windows Toast Notification ──────┐")
-    print("│                                    │")
-    print("│ 🚨 WiFi Deauth Attack Detected!   │")
-    print("│                                    │")
-    print("│ Attacker: 00:11:22:33:44:55       │")
-    print("│ Time: 17:30:15                     │")
-    print("│                                    │")
-    print("│ Click to open WiFi Detector        │")
-    print("│                                    │")
-    print("└────────────────────────────────────┘")
-    print()
-    
-    # Discord Webhook Mockup
-    print("📱 DISCORD WEBHOOK MESSAGE")
-    print("─" * 78)
-    print("┌─ Discord Channel: #security-alerts ─────────────────────────────────────────┐")
-    print("│                                                                              │")
-    print("│ WiFi Deauth Detector                                              Today     │")
-    print("│                                                                              │")
-    print("│ ┌──────────────────────────────────────────────────────────────────────────┐ │")
-    print("│ │ 🚨 WiFi Deauth Attack Detected!                                         │ │")
-    print("│ │                                                                          │ │")
-    print("│ │ Attacker MAC    │ 00:11:22:33:44:55     Target MAC     │ aa:bb:cc:dd:ee:ff │")
-    print("│ │                 │                       Timestamp      │ 2024-08-03       │")
-    print("│ │                 │                                       │ 17:30:15         │")
-    print("│ │                                                                          │ │")
-    print("│ │ WiFi Deauth Detector                                                     │ │")
-    print("│ └──────────────────────────────────────────────────────────────────────────┘ │")
-    print("│                                                                              │")
-    print("└──────────────────────────────────────────────────────────────────────────────┘")
-    print()
+import os
+import re
+import sys
+from functools import lru_cache
+
+# Section separator, built once rather than multiplied per use
+_SEP78 = "─" * 78
+
+# Version shown in the mockup, formatted into the title bar once at import
+_VERSION = "v1.0.0"
+_TITLE_ROW = f"│                        WiFi Deauth Detector {_VERSION}                        │"
+
+# Emoji and their plain stand-ins; stdout gets the plain form unless run with
+# --unicode or GUI_MOCKUP_UNICODE=1, since emoji are slow or garbled on legacy
+# console codepages
+_PLAIN_SYMBOLS = (
+    ("📱 ", ""), ("🖥️  ", ""), ("⚙️  ", ""), ("📄 ", ""), ("🔔 ", ""),
+    ("💡 ", ""), ("💾 ", ""),
+    ("🟢", "[ON]"), ("🚨", "[!]"), ("✅", "[OK]"),
+)
+_BOX_PADDING_RE = re.compile(r' +(?=│(?: │)?$)')
+
+# Window chrome shared by the three tab mockups
+_FRAME_TOP = f"""\
+┌────────────────────────────────────────────────────────────────────────────┐
+{_TITLE_ROW}
+├────────────────────────────────────────────────────────────────────────────┤
+"""
+_TABS_ROW = """\
+│ [Monitor] [Settings] [Logs]                                                │
+├────────────────────────────────────────────────────────────────────────────┤
+"""
+_FRAME_BOT = """\
+└────────────────────────────────────────────────────────────────────────────┘
+"""
+
+
+def _tab(body):
+    """Wrap a tab's inner panels in the shared window frame"""
+    return f"{_FRAME_TOP}{_TABS_ROW}{body}{_FRAME_BOT}"
+
+
+_MONITOR_PANELS = """\
+│                                                                            │
+│ ┌─ Detection Status ─────────────────────────────────────────────────────┐ │
+│ │                                                                        │ │
+│ │  🟢 Monitoring Active                                                  │ │
+│ │                                                                        │ │
+│ │  [Start Monitoring] [Stop Monitoring] [Test Detection]                │ │
+│ │                                                                        │ │
+│ └────────────────────────────────────────────────────────────────────────┘ │
+│                                                                            │
+│ ┌─ Recent Alerts ────────────────────────────────────────────────────────┐ │
+│ │                                                                        │ │
+│ │ [2024-08-03 17:30:15] ATTACK! Attacker: 00:11:22:33:44:55             │ │
+│ │                               → Target: aa:bb:cc:dd:ee:ff              │ │
+│ │                                                                        │ │
+│ │ [2024-08-03 17:32:22] ATTACK! Attacker: 66:77:88:99:aa:bb             │ │
+│ │                               → Target: cc:dd:ee:ff:00:11              │ │
+│ │                                                                        │ │
+│ └────────────────────────────────────────────────────────────────────────┘ │
+│                                                                            │
+│ ┌─ Statistics ───────────────────────────────────────────────────────────┐ │
+│ │                                                                        │ │
+│ │ Total Attacks Detected: 2                                             │ │
+│ │ Last Attack: 2024-08-03 17:32:22                                      │ │
+│ │                                                                        │ │
+│ └────────────────────────────────────────────────────────────────────────┘ │
+│                                                                            │
+"""
+
+_SETTINGS_PANELS = """\
+│                                                                            │
+│ ┌─ Auto Network Switching ───────────────────────────────────────────────┐ │
+│ │                                                                        │ │
+│ │ ☑ Enable auto-switch on attack                                        │ │
+│ │ ☑ Confirm before switching                                            │ │
+│ │                                                                        │ │
+│ │ Backup Network: [BackupWiFi_5G        ▼] [Refresh Networks]           │ │
+│ │                                                                        │ │
+│ └────────────────────────────────────────────────────────────────────────┘ │
+│                                                                            │
+│ ┌─ Discord Webhook Alerts ───────────────────────────────────────────────┐ │
+│ │                                                                        │ │
+│ │ ☑ Enable Discord alerts                                               │ │
+│ │                                                                        │ │
+│ │ Webhook URL: [https://discord.com/api/webhooks/demo/url              ] │ │
+│ │                                                                        │ │
+│ │ [Test Webhook]                                                         │ │
+│ │                                                                        │ │
+│ └────────────────────────────────────────────────────────────────────────┘ │
+│                                                                            │
+│ ┌─ General Settings ─────────────────────────────────────────────────────┐ │
+│ │                                                                        │ │
+│ │ ☑ Enable system notifications                                         │ │
+│ │ ☑ Log attacks to file                                                 │ │
+│ │                                                                        │ │
+│ │ [Save Settings]                                                        │ │
+│ │                                                                        │ │
+│ └────────────────────────────────────────────────────────────────────────┘ │
+│                                                                            │
+"""
+
+_LOGS_PANELS = """\
+│                                                                            │
+│ ┌─ Event Log ────────────────────────────────────────────────────────────┐ │
+│ │                                                                        │ │
+│ │ [2024-08-03 17:29:45] Application started                             │ │
+│ │ [2024-08-03 17:29:46] Monitoring configuration loaded                 │ │
+│ │ [2024-08-03 17:29:47] Network profiles detected: 5                    │ │
+│ │ [2024-08-03 17:29:50] Monitoring started                              │ │
+│ │ [2024-08-03 17:30:15] DEAUTH ATTACK - Attacker: 00:11:22:33:44:55    │ │
+│ │                       → Target: aa:bb:cc:dd:ee:ff                     │ │
+│ │ [2024-08-03 17:30:17] Successfully switched to backup network:       │ │
+│ │                       BackupWiFi_5G                                   │ │
+│ │ [2024-08-03 17:32:22] DEAUTH ATTACK - Attacker: 66:77:88:99:aa:bb    │ │
+│ │                       → Target: cc:dd:ee:ff:00:11                     │ │
+│ │                                                                        │ │
+│ │ ▼ More logs...                                                         │ │
+│ │                                                                        │ │
+│ └────────────────────────────────────────────────────────────────────────┘ │
+│                                                                            │
+│ [Clear Logs] [Export Logs]                                                 │
+│                                                                            │
+"""
+
+
+@lru_cache(maxsize=None)
+def _mockup_text():
+    """Assemble the mockup on first use; later calls return the same string"""
+    return "".join((
+        f"""\
+📱 WiFi Deauth Detector {_VERSION} - GUI Mockup
+================================================================================
+
+🖥️  MONITOR TAB
+{_SEP78}
+""",
+        _tab(_MONITOR_PANELS),
+        f"""\
+
+⚙️  SETTINGS TAB
+{_SEP78}
+""",
+        _tab(_SETTINGS_PANELS),
+        f"""\
+
+📄 LOGS TAB
+{_SEP78}
+""",
+        _tab(_LOGS_PANELS),
+        f"""\
+
+🔔 SYSTEM NOTIFICATION
+{_SEP78}
+┌─ Windows Toast Notification ──────┐
+│                                    │
+│ 🚨 WiFi Deauth Attack Detected!   │
+│                                    │
+│ Attacker: 00:11:22:33:44:55       │
+│ Time: 17:30:15                     │
+│                                    │
+│ Click to open WiFi Detector        │
+│                                    │
+└────────────────────────────────────┘
+
+📱 DISCORD WEBHOOK MESSAGE
+{_SEP78}
+┌─ Discord Channel: #security-alerts ─────────────────────────────────────────┐
+│                                                                              │
+│ WiFi Deauth Detector                                              Today     │
+│                                                                              │
+│ ┌──────────────────────────────────────────────────────────────────────────┐ │
+│ │ 🚨 WiFi Deauth Attack Detected!                                         │ │
+│ │                                                                          │ │
+│ │ Attacker MAC    │ 00:11:22:33:44:55     Target MAC     │ aa:bb:cc:dd:ee:ff │
+│ │                 │                       Timestamp      │ 2024-08-03       │
+│ │                 │                                       │ 17:30:15         │
+│ │                                                                          │ │
+│ │ WiFi Deauth Detector                                                     │ │
+│ └──────────────────────────────────────────────────────────────────────────┘ │
+│                                                                              │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+💡 Key Features Highlighted:
+   ✅ Real-time monitoring with visual status indicators
+   ✅ Comprehensive settings for all features
+   ✅ Auto network switching with backup configuration
+   ✅ Discord webhook integration with rich formatting
+   ✅ Complete event logging with export capabilities
+   ✅ System notifications for immediate alerts
+   ✅ Clean, professional interface design
+""",
+    ))
+
+
+def _plain(text):
+    """Swap emoji for plain stand-ins, keeping boxed lines' right border in place"""
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        grown = 0  # Change in display columns; an emoji is two columns wide
+        for symbol, stand_in in _PLAIN_SYMBOLS:
+            count = line.count(symbol)
+            if count:
+                line = line.replace(symbol, stand_in)
+                grown += count * (len(stand_in) - 2 - symbol.count(" "))
+        if grown and line.endswith("│"):
+            line = _BOX_PADDING_RE.sub(lambda m: " " * max(len(m.group()) - grown, 1), line, count=1)
+        lines[i] = line
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _plain_mockup_text():
+    """Plain-symbol variant of the mockup for the console, built once"""
+    return _plain(_mockup_text())
+
+
+@lru_cache(maxsize=None)
+def _mockup_bytes(unicode=True):
+    """UTF-8 encoding of the mockup, also built once per variant"""
+    return (_mockup_text() if unicode else _plain_mockup_text()).encode("utf-8")
+
+def create_gui_mockup(unicode: bool = False):
+    """Create ASCII art mockup of the GUI and return its text
+
+    unicode selects the emoji version; the default plain symbols suit any console.
+    """
+    text = _mockup_text() if unicode else _plain_mockup_text()
     
-    print("💡 Key Features Highlighted:")
-    print("   ✅ Real-time monitoring with visual status indicators")
-    print("   ✅ Comprehensive settings for all features")
-    print("   ✅ Auto network switching with backup configuration")
-    print("   ✅ Discord webhook integration with rich formatting")
-    print("   ✅ Complete event logging with export capabilities")
-    print("   ✅ System notifications for immediate alerts")
-    print("   ✅ Clean, professional interface design")
-
-def save_mockup_to_file():
+    # One write for the whole mockup instead of a print per line. A UTF-8
+    # stream takes the pre-encoded bytes; redirected or wrapped streams
+    # without a binary buffer still get the text.
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None and (sys.stdout.encoding or "").lower().replace("-", "") == "utf8":
+        sys.stdout.flush()  # Keep anything already written in order
+        buffer.write(_mockup_bytes(unicode))
+        buffer.flush()
+    else:
+        sys.stdout.write(text)
+    return text
+
+def save_mockup_to_file(unicode: bool = False):
     """Save the mockup to a file for documentation"""
-    import sys
-    from io import StringIO
-    
-    # Capture the mockup output
-    old_stdout = sys.stdout
-    sys.stdout = captured_output = StringIO()
-    
-    create_gui_mockup()
-    
-    sys.stdout = old_stdout
-    mockup_content = captured_output.getvalue()
-    
-    # Save to file
-    with open("GUI_Mockup.txt", "w", encoding="utf-8") as f:
-        f.write(mockup_content)
+    # Pre-encoded bytes in binary mode: no per-write encoding, LF line endings on every OS
+    with open("GUI_Mockup.txt", "wb") as f:
+        f.write(_mockup_bytes())
     
-    print("💾 GUI mockup saved to 'GUI_Mockup.txt'")
+    # The file is always the full UTF-8 version; only the console message varies
+    message = "💾 GUI mockup saved to 'GUI_Mockup.txt'"
+    print(message if unicode else _plain(message))
 
 if __name__ == "__main__":
-    create_gui_mockup()
-    save_mockup_to_file()
\ No newline at end of file
+    unicode = "--unicode" in sys.argv[1:] or os.environ.get("GUI_MOCKUP_UNICODE") == "1"
+    create_gui_mockup(unicode)
+    save_mockup_to_file(unicode)
\ No newline at end of file
@@ -8,17 +8,22 @@ import sys
 import os
 import json
 import time
+import queue
 import threading
 from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QLabel, QTextEdit, QGroupBox,
                              QLineEdit, QCheckBox, QComboBox, QMessageBox, QSystemTrayIcon,
-                             QMenu, QAction, QTabWidget, QFormLayout, QSpinBox)
-from PyQt5.QtCore import QTimer, pyqtSignal, QObject, QThread
+                             QMenu, QAction, QTabWidget, QFormLayout, QSpinBox, QDialog)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QThread
 from PyQt5.QtGui import QIcon, QFont, QPixmap
 import subprocess
-import requests
-from plyer import notification
+# requests and plyer are imported on first use to keep startup light
+# orjson is optional; it serializes webhook payloads and settings straight to bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
 # Import enhanced components - fallback to original if not available
 try:
     from enhanced_wifi_monitor import EnhancedWiFiMonitor as WindowsWiFiMonitor, LegacyDeauthDetector
@@ -32,7 +37,7 @@ except ImportError as e:
 
 class DeauthDetector(QObject):
     """Enhanced deauth detection engine using Windows WiFi monitoring"""
-    attack_detected = pyqtSignal(str, str, str)  # reason, timestamp, details
+    attack_detected = pyqtSignal(object)  # event dict, see _handle_suspicious_disconnect
     
     def __init__(self, use_real_monitoring=True):
         super().__init__()
@@ -67,12 +72,28 @@ class DeauthDetector(QObject):
     
     def _handle_suspicious_disconnect(self, reason, timestamp, details):
         """Handle suspicious disconnect detected by Windows WiFi monitor"""
-        # Emit in the format expected by the GUI (reason as "attacker", details as "target")
-        self.attack_detected.emit(reason, details, timestamp)
+        # One dict crosses the thread boundary, already worded for display
+        self.attack_detected.emit({
+            'kind': 'real',
+            'reason': reason,
+            'details': details,
+            'timestamp': timestamp,
+            'alert': f"SUSPICIOUS ACTIVITY! {reason}: {details}",
+            'title': "WiFi Security Alert!",
+            'message': reason
+        })
     
     def _handle_legacy_attack(self, attacker_mac, target_mac, timestamp):
         """Handle legacy simulated attack for demo purposes"""
-        self.attack_detected.emit(attacker_mac, target_mac, timestamp)
+        self.attack_detected.emit({
+            'kind': 'simulated',
+            'reason': attacker_mac,
+            'details': target_mac,
+            'timestamp': timestamp,
+            'alert': f"SIMULATED ATTACK! Attacker: {attacker_mac} → Target: {target_mac}",
+            'title': "WiFi Deauth Attack Detected!",
+            'message': f"Attacker: {attacker_mac}"
+        })
     
     def get_recent_events(self):
         """Get recent WiFi events for display"""
@@ -88,25 +109,60 @@ class DeauthDetector(QObject):
         else:
             return []
 
+class CallableWorker(QThread):
+    """Runs one blocking call off the GUI thread and emits its return value"""
+    result = pyqtSignal(object)
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+    
+    def run(self):
+        self.result.emit(self.fn(*self.args))
+
 # NetworkManager is now imported from secure_network_manager if available
 if not ENHANCED_MODE:
+    import wlan_api
+    
+    PROFILE_CACHE_TTL = 30  # seconds
+    _profiles_cache = (0.0, None)  # (monotonic time, profile names)
+    
+    # Profile queries go through one long-lived netsh process when possible,
+    # and netsh is spawned without a console window
+    try:
+        from secure_network_manager import NETSH_SPAWN_KWARGS, NetshSession
+        _netsh_session = NetshSession() if os.name == 'nt' else None
+    except ImportError:
+        NETSH_SPAWN_KWARGS = {}
+        _netsh_session = None
+    
     class NetworkManager:
         """Legacy network switching functionality with basic security"""
         
         @staticmethod
-        def get_available_profiles():
-            """Get list of available WiFi profiles"""
+        def get_available_profiles(force=False):
+            """Get list of available WiFi profiles, cached briefly unless forced"""
+            global _profiles_cache
+            cached_at, cached = _profiles_cache
+            if not force and cached is not None and time.monotonic() - cached_at < PROFILE_CACHE_TTL:
+                return list(cached)
+            
             try:
-                result = subprocess.run(['netsh', 'wlan', 'show', 'profiles'], 
-                                      capture_output=True, text=True, timeout=10)
-                profiles = []
-                for line in result.stdout.split('\n'):
-                    if 'All User Profile' in line and ':' in line:
-                        profile_name = line.split(':')[1].strip()
-                        # Basic sanitization
-                        if profile_name and len(profile_name) <= 32:
-                            profiles.append(profile_name)
-                return profiles
+                # One in-process wlanapi.dll call where available, netsh otherwise
+                names = wlan_api.list_profiles()
+                if names is None:
+                    output = _netsh_session.run('wlan show profiles', 10) if _netsh_session else None
+                    if output is None:
+                        output = subprocess.run(['netsh', 'wlan', 'show', 'profiles'], 
+                                                capture_output=True, text=True, timeout=10,
+                                                **NETSH_SPAWN_KWARGS).stdout
+                    names = [line.split(':')[1].strip() for line in output.split('\n')
+                             if 'All User Profile' in line and ':' in line]
+                # Basic sanitization
+                profiles = [name for name in names if name and len(name) <= 32]
+                _profiles_cache = (time.monotonic(), profiles)
+                return list(profiles)
             except Exception as e:
                 print(f"Error getting WiFi profiles: {e}")
                 return []
@@ -114,6 +170,7 @@ if not ENHANCED_MODE:
         @staticmethod
         def connect_to_network(profile_name):
             """Connect to a specific WiFi network with basic validation"""
+            global _profiles_cache
             try:
                 # Basic input validation
                 if not profile_name or len(profile_name) > 32:
@@ -121,47 +178,201 @@ if not ENHANCED_MODE:
                     return False
                 
                 result = subprocess.run(['netsh', 'wlan', 'connect', f'name="{profile_name}"'], 
-                                      capture_output=True, text=True, timeout=15)
+                                      capture_output=True, text=True, timeout=15,
+                                      **NETSH_SPAWN_KWARGS)
+                if result.returncode == 0:
+                    _profiles_cache = (0.0, None)
                 return result.returncode == 0
             except Exception as e:
                 print(f"Error connecting to network {profile_name}: {e}")
                 return False
 
+_log_stamp = (None, "")  # (epoch second, formatted local time)
+
+def _log_timestamp():
+    """Local "YYYY-MM-DD HH:MM:SS", formatted at most once per second"""
+    global _log_stamp
+    second = int(time.time())
+    if second != _log_stamp[0]:
+        t = time.localtime(second)
+        _log_stamp = (second, f"{t.tm_year}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+                              f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+    return _log_stamp[1]
+
+SWITCH_PROMPT_DEBOUNCE = 5.0  # seconds before a dismissed switch prompt may reappear
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL_MS = 2000
+
+_http_session = None
+
+def get_http_session():
+    """Get the shared keep-alive HTTP session used for webhook delivery"""
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _http_session = requests.Session()
+        _http_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return _http_session
+
+def close_http_session():
+    """Close the shared HTTP session's pooled connections, if one was opened"""
+    global _http_session
+    if _http_session is not None:
+        _http_session.close()
+        _http_session = None
+
+# Queued alerts are coalesced into one message per webhook every batch window,
+# with repeats of the same attacker/target collapsed into one counted embed
+ALERT_BATCH_WINDOW = 2.0     # seconds
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord's per-message embed limit
+MAX_RATE_LIMIT_RETRIES = 3
+ALERT_SHUTDOWN_TIMEOUT = 5.0  # seconds to wait for the last batch on quit
+
+_alert_queue = queue.Queue()
+_alert_worker = None
+_alert_worker_lock = threading.Lock()
+_ALERT_STOP = object()  # Queued last on shutdown; the worker flushes and exits
+
+def _alert_worker_loop():
+    """Drain queued alerts, posting each burst as one message per webhook"""
+    stopping = False
+    while not stopping:
+        batches = {}  # webhook_url -> (webhook, {(attacker, target): [embed, count, first timestamp]})
+        item = _alert_queue.get()
+        deadline = time.monotonic() + ALERT_BATCH_WINDOW
+        while item is not None:
+            if item is _ALERT_STOP:
+                stopping = True
+                break
+            webhook, key, timestamp, embed = item
+            entries = batches.setdefault(webhook.webhook_url, (webhook, {}))[1]
+            entry = entries.get(key)
+            if entry is None:
+                entries[key] = [embed, 1, timestamp]
+                if len(entries) >= MAX_EMBEDS_PER_MESSAGE:
+                    break
+            else:
+                entry[1] += 1
+                DiscordWebhook._mark_repeats(entry[0], entry[1], entry[2], timestamp)
+            try:
+                item = _alert_queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+        
+        for webhook, entries in batches.values():
+            webhook._post([entry[0] for entry in entries.values()], retries=MAX_RATE_LIMIT_RETRIES)
+
+def shutdown_alert_worker(timeout=ALERT_SHUTDOWN_TIMEOUT):
+    """Send any batched alerts and stop the worker, waiting at most timeout seconds"""
+    global _alert_worker
+    with _alert_worker_lock:
+        if _alert_worker is None:
+            return
+        _alert_queue.put(_ALERT_STOP)
+        _alert_worker.join(timeout)
+        if _alert_worker.is_alive():
+            print("Alert delivery did not finish before shutdown; pending alerts may be lost")
+        _alert_worker = None
+
+def shutdown_alert_delivery():
+    """Flush pending alerts, then close the shared HTTP session they are sent on"""
+    shutdown_alert_worker()
+    close_http_session()
+
 class DiscordWebhook:
     """Handles Discord webhook notifications"""
     
-    def __init__(self, webhook_url):
+    # Constant parts of every alert embed and request; only the fields vary
+    _EMBED_TEMPLATE = {
+        "title": "🚨 WiFi Deauth Attack Detected!",
+        "color": 0xff0000,
+        "footer": {"text": "WiFi Deauth Detector"}
+    }
+    _HEADERS = {"Content-Type": "application/json"}
+    
+    def __init__(self, webhook_url, session=None):
         self.webhook_url = webhook_url
+        self._session = session
+    
+    @property
+    def session(self):
+        """HTTP session, created on first send"""
+        if self._session is not None:
+            return self._session
+        # Reuse pooled connections so repeated alerts skip the TLS handshake.
+        # Not cached here, so a webhook never holds a session that was closed.
+        return get_http_session()
+    
+    @classmethod
+    def _build_embed(cls, attacker_mac, target_mac, timestamp):
+        """Build the Discord embed for one alert"""
+        embed = cls._EMBED_TEMPLATE.copy()
+        embed["fields"] = [
+            {"name": "Attacker MAC", "value": attacker_mac, "inline": True},
+            {"name": "Target MAC", "value": target_mac, "inline": True},
+            {"name": "Timestamp", "value": timestamp, "inline": False}
+        ]
+        return embed
+    
+    @staticmethod
+    def _mark_repeats(embed, count, first_timestamp, last_timestamp):
+        """Show how often an identical alert repeated within one batch"""
+        embed["fields"][2]["value"] = f"{first_timestamp} → {last_timestamp}"
+        if len(embed["fields"]) == 3:
+            embed["fields"].append({"name": "Occurrences", "value": "", "inline": True})
+        embed["fields"][3]["value"] = f"×{count}"
+    
+    def _post(self, embeds, retries=0):
+        """POST embeds in one message, waiting out up to `retries` rate limits"""
+        try:
+            data = {"embeds": embeds}
+            body = orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8')
+            for _ in range(retries + 1):
+                response = self.session.post(self.webhook_url, data=body,
+                                             headers=self._HEADERS, timeout=10)
+                if response.status_code != 429:
+                    return response.status_code == 204
+                retry_after = float(response.headers.get("Retry-After", 1))
+                print(f"Discord rate limit hit, retrying in {retry_after}s")
+                time.sleep(retry_after)
+            return False
+        except Exception as e:
+            print(f"Error sending Discord webhook: {e}")
+            return False
         
     def send_alert(self, attacker_mac, target_mac, timestamp):
         """Send deauth alert to Discord"""
         if not self.webhook_url:
             return False
-            
-        try:
-            embed = {
-                "title": "🚨 WiFi Deauth Attack Detected!",
-                "color": 0xff0000,
-                "fields": [
-                    {"name": "Attacker MAC", "value": attacker_mac, "inline": True},
-                    {"name": "Target MAC", "value": target_mac, "inline": True},
-                    {"name": "Timestamp", "value": timestamp, "inline": False}
-                ],
-                "footer": {"text": "WiFi Deauth Detector"}
-            }
-            
-            data = {"embeds": [embed]}
-            response = requests.post(self.webhook_url, json=data, timeout=10)
-            return response.status_code == 204
-        except Exception as e:
-            print(f"Error sending Discord webhook: {e}")
+        
+        return self._post([self._build_embed(attacker_mac, target_mac, timestamp)])
+    
+    def queue_alert(self, attacker_mac, target_mac, timestamp):
+        """Queue an alert for background delivery; bursts are batched into one message"""
+        global _alert_worker
+        if not self.webhook_url:
             return False
+        
+        with _alert_worker_lock:
+            if _alert_worker is None:
+                _alert_worker = threading.Thread(target=_alert_worker_loop, daemon=True)
+                _alert_worker.start()
+        _alert_queue.put((self, (attacker_mac, target_mac), timestamp,
+                          self._build_embed(attacker_mac, target_mac, timestamp)))
+        return True
 
 # SettingsManager is now imported from secure_settings_manager if available
 if not ENHANCED_MODE:
     class SettingsManager:
         """Legacy settings management with basic security"""
         
+        # Per-key validators; other keys only need to match their default's type
+        _VALIDATORS = {
+            "backup_network": lambda v: isinstance(v, str) and len(v) <= 32,
+            "discord_webhook": lambda v: isinstance(v, str) and (not v or v.startswith('https://discord.com/api/webhooks/')),
+        }
+        
         def __init__(self, settings_file="settings.json"):
             self.settings_file = settings_file
             self.default_settings = {
@@ -174,26 +385,25 @@ if not ENHANCED_MODE:
                 "log_attacks": True,
                 "demo_mode": False
             }
+            self._saved_settings = None  # Snapshot of what is on disk
             self.settings = self.load_settings()
         
         def load_settings(self):
             """Load settings from file with validation"""
             try:
                 if os.path.exists(self.settings_file):
-                    with open(self.settings_file, 'r') as f:
-                        loaded = json.load(f)
+                    with open(self.settings_file, 'rb') as f:
+                        data = f.read()
+                        loaded = orjson.loads(data) if orjson else json.loads(data)
                         # Merge with defaults and validate
                         settings = self.default_settings.copy()
-                        for key, value in loaded.items():
-                            if key in self.default_settings:
-                                # Basic validation
-                                if key == "backup_network" and isinstance(value, str) and len(value) <= 32:
-                                    settings[key] = value
-                                elif key == "discord_webhook" and isinstance(value, str):
-                                    if not value or value.startswith('https://discord.com/api/webhooks/'):
-                                        settings[key] = value
-                                elif isinstance(value, type(self.default_settings[key])):
-                                    settings[key] = value
+                        validators = self._VALIDATORS
+                        for key, default in self.default_settings.items():
+                            value = loaded.get(key, default)
+                            validator = validators.get(key)
+                            if validator(value) if validator else isinstance(value, type(default)):
+                                settings[key] = value
+                        self._saved_settings = settings.copy()
                         return settings
                 return self.default_settings.copy()
             except Exception as e:
@@ -202,14 +412,23 @@ if not ENHANCED_MODE:
         
         def save_settings(self):
             """Save settings to file with basic security"""
+            # Nothing changed since the last load/save: skip the write and chmod
+            if self.settings == self._saved_settings and os.path.exists(self.settings_file):
+                return True
+            
             try:
                 # Set restrictive permissions
-                with open(self.settings_file, 'w') as f:
-                    json.dump(self.settings, f, indent=2)
+                if orjson:
+                    data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(self.settings, indent=2).encode('utf-8')
+                with open(self.settings_file, 'wb') as f:
+                    f.write(data)
                 try:
                     os.chmod(self.settings_file, 0o600)  # Owner read/write only
                 except:
                     pass  # May fail on Windows
+                self._saved_settings = self.settings.copy()
                 return True
             except Exception as e:
                 print(f"Error saving settings: {e}")
@@ -232,29 +451,43 @@ if not ENHANCED_MODE:
 class WiFiDeauthDetectorGUI(QMainWindow):
     """Main GUI window"""
     
+    _status_font = None  # Shared bold status font, built once a QApplication exists
+    
     def __init__(self):
         super().__init__()
         self.settings = SettingsManager()
+        self._log_file = None  # Opened on first write and kept open, flushed on a timer
+        self._workers = {}  # Task name -> latest CallableWorker for that task
+        self._pending_switch_dialog = None  # Open auto-switch prompt, if any
+        self._switch_prompt_closed_at = 0.0
+        self._total_attacks = 0
         
         # Determine monitoring mode based on platform and settings
-        use_real_monitoring = os.name == 'nt'  # Windows
-        if self.settings.get("demo_mode", False):
-            use_real_monitoring = False
-            
-        self.detector = DeauthDetector(use_real_monitoring=use_real_monitoring)
+        # Fixed for the lifetime of the window; demo mode changes apply on restart
+        self._use_real_monitoring = os.name == 'nt' and not self.settings.get("demo_mode", False)
+        
+        self.detector = DeauthDetector(use_real_monitoring=self._use_real_monitoring)
         self.discord_webhook = DiscordWebhook(self.settings.get("discord_webhook"))
         self.network_manager = NetworkManager()
+        self._cache_alert_settings()
         
         # Setup UI
+        if WiFiDeauthDetectorGUI._status_font is None:
+            WiFiDeauthDetectorGUI._status_font = QFont("Arial", 12, QFont.Bold)
         self.init_ui()
         self.setup_system_tray()
         
-        # Connect signals
-        self.detector.attack_detected.connect(self.handle_attack_detected)
+        # Connect signals; queued because monitors emit from worker threads
+        self.detector.attack_detected.connect(self.handle_attack_detected, Qt.QueuedConnection)
         
         # Load settings into UI
         self.load_settings_to_ui()
         
+        # Buffered log lines reach the disk every couple of seconds
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start(LOG_FLUSH_INTERVAL_MS)
+        
     def init_ui(self):
         """Initialize the user interface"""
         title = "WiFi Deauth Detector v2.1" + (" [Enhanced]" if ENHANCED_MODE else " [Standard]")
@@ -292,8 +525,7 @@ class WiFiDeauthDetectorGUI(QMainWindow):
         info_group = QGroupBox("Detection Method")
         info_layout = QVBoxLayout(info_group)
         
-        use_real_monitoring = os.name == 'nt' and not self.settings.get("demo_mode", False)
-        if use_real_monitoring:
+        if self._use_real_monitoring:
             mode_desc = "Enhanced" if ENHANCED_MODE else "Normal"
             method_text = f"🔍 {mode_desc} Mode: Advanced WiFi connection monitoring\n" \
                          "• Sophisticated pattern recognition\n" \
@@ -315,7 +547,7 @@ class WiFiDeauthDetectorGUI(QMainWindow):
         status_layout = QVBoxLayout(status_group)
         
         self.status_label = QLabel("⚪ Monitoring Stopped")
-        self.status_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.status_label.setFont(self._status_font)
         status_layout.addWidget(self.status_label)
         
         # Control buttons
@@ -340,6 +572,8 @@ class WiFiDeauthDetectorGUI(QMainWindow):
         self.alerts_display = QTextEdit()
         self.alerts_display.setReadOnly(True)
         self.alerts_display.setMaximumHeight(200)
+        # Drop the oldest lines so appends stay cheap in long sessions
+        self.alerts_display.document().setMaximumBlockCount(500)
         alerts_layout.addWidget(self.alerts_display)
         
         layout.addWidget(alerts_group)
@@ -373,7 +607,8 @@ class WiFiDeauthDetectorGUI(QMainWindow):
         self.backup_network_combo = QComboBox()
         self.backup_network_combo.setEditable(True)
         self.refresh_networks_btn = QPushButton("Refresh Networks")
-        self.refresh_networks_btn.clicked.connect(self.refresh_network_list)
+        # An explicit refresh always re-queries; startup may use the cached list
+        self.refresh_networks_btn.clicked.connect(lambda: self.refresh_network_list(force=True))
         
         network_layout.addRow(self.auto_switch_cb)
         network_layout.addRow(self.confirm_switch_cb)
@@ -430,6 +665,7 @@ class WiFiDeauthDetectorGUI(QMainWindow):
         # Log display
         self.log_display = QTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.document().setMaximumBlockCount(2000)
         layout.addWidget(self.log_display)
         
         # Log controls
@@ -448,16 +684,16 @@ class WiFiDeauthDetectorGUI(QMainWindow):
     
     def setup_system_tray(self):
         """Setup system tray icon with enhanced normal mode information"""
+        self._tray_mode_action = None
         if QSystemTrayIcon.isSystemTrayAvailable():
             self.tray_icon = QSystemTrayIcon(self)
             
-            # Create tray menu
-            tray_menu = QMenu()
+            # Create tray menu once; kept on self so it outlives this method
+            tray_menu = self._tray_menu = QMenu()
             
             # Status info
-            use_real_monitoring = os.name == 'nt' and not self.settings.get("demo_mode", False)
-            mode_text = "Normal Mode" if use_real_monitoring else "Demo Mode"
-            mode_action = QAction(f"🔍 {mode_text} Active", self)
+            mode_text = "Normal Mode" if self._use_real_monitoring else "Demo Mode"
+            mode_action = self._tray_mode_action = QAction(f"🔍 {mode_text} Active", self)
             mode_action.setEnabled(False)
             tray_menu.addAction(mode_action)
             
@@ -484,7 +720,7 @@ class WiFiDeauthDetectorGUI(QMainWindow):
             
             tray_menu.addSeparator()
             quit_action = QAction("Quit", self)
-            quit_action.triggered.connect(self.close)
+            quit_action.triggered.connect(QApplication.instance().quit)
             tray_menu.addAction(quit_action)
             
             self.tray_icon.setContextMenu(tray_menu)
@@ -494,6 +730,16 @@ class WiFiDeauthDetectorGUI(QMainWindow):
             # Add double-click to show window
             self.tray_icon.activated.connect(self._tray_icon_activated)
     
+    def _update_tray_mode(self):
+        """Relabel the tray mode entry in place when a saved demo mode awaits restart"""
+        if self._tray_mode_action is None:
+            return
+        mode_text = "Normal Mode" if self._use_real_monitoring else "Demo Mode"
+        label = f"🔍 {mode_text} Active"
+        if (os.name == 'nt' and not self.settings.get("demo_mode", False)) != self._use_real_monitoring:
+            label += " (restart to change)"
+        self._tray_mode_action.setText(label)
+    
     def _tray_icon_activated(self, reason):
         """Handle tray icon activation"""
         if reason == QSystemTrayIcon.DoubleClick:
@@ -517,56 +763,39 @@ class WiFiDeauthDetectorGUI(QMainWindow):
         self.stop_btn.setEnabled(False)
         self.log_message("Monitoring stopped")
     
-    def handle_attack_detected(self, reason_or_attacker, details_or_target, timestamp):
+    def handle_attack_detected(self, event):
         """Handle detected deauth attack or suspicious event"""
-        # Determine if this is the new format (reason, details, timestamp) or legacy (attacker, target, timestamp)
-        use_real_monitoring = os.name == 'nt' and not self.settings.get("demo_mode", False)
-        
-        if use_real_monitoring:
-            # New format: reason, details, timestamp
-            alert_text = f"[{timestamp}] SUSPICIOUS ACTIVITY! {reason_or_attacker}: {details_or_target}"
-            notification_title = "WiFi Security Alert!"
-            notification_message = f"{reason_or_attacker}"
-            
-            # For Discord webhook, adapt to expected format
-            webhook_attacker = reason_or_attacker
-            webhook_target = details_or_target
-        else:
-            # Legacy format: attacker_mac, target_mac, timestamp
-            alert_text = f"[{timestamp}] SIMULATED ATTACK! Attacker: {reason_or_attacker} → Target: {details_or_target}"
-            notification_title = "WiFi Deauth Attack Detected!"
-            notification_message = f"Attacker: {reason_or_attacker}"
-            
-            webhook_attacker = reason_or_attacker
-            webhook_target = details_or_target
+        timestamp = event['timestamp']
+        alert_text = f"[{timestamp}] {event['alert']}"
         
         # Update UI
         self.alerts_display.append(alert_text)
         
         # Update statistics
-        current_total = int(self.total_attacks_label.text())
-        self.total_attacks_label.setText(str(current_total + 1))
+        self._total_attacks += 1
+        self.total_attacks_label.setText(str(self._total_attacks))
         self.last_attack_label.setText(timestamp)
         
         # Log to file
-        if self.settings.get("log_attacks"):
+        if self._log_attacks:
             self.log_message(f"SECURITY EVENT - {alert_text}")
         
         # System notification
-        if self.settings.get("notifications_enabled"):
+        if self._notifications_enabled:
+            from plyer import notification
             notification.notify(
-                title=notification_title,
-                message=notification_message,
+                title=event['title'],
+                message=event['message'],
                 timeout=10
             )
         
         # Discord webhook
-        if self.settings.get("discord_enabled"):
-            webhook = DiscordWebhook(self.settings.get("discord_webhook"))
-            webhook.send_alert(webhook_attacker, webhook_target, timestamp)
+        if self._discord_enabled:
+            # Queued so a burst of events never blocks the GUI on HTTP
+            self.discord_webhook.queue_alert(event['reason'], event['details'], timestamp)
         
         # Auto network switch (only for real suspicious events, not simulated)
-        if use_real_monitoring and self.settings.get("auto_switch_enabled"):
+        if event['kind'] == 'real' and self._auto_switch_enabled:
             self.handle_auto_switch()
     
     def handle_auto_switch(self):
@@ -576,38 +805,108 @@ class WiFiDeauthDetectorGUI(QMainWindow):
             return
         
         if self.settings.get("auto_switch_confirm"):
-            reply = QMessageBox.question(
-                self, 
-                "Network Switch Confirmation",
-                f"Suspicious WiFi activity detected! Switch to backup network '{backup_network}'?",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            if reply != QMessageBox.Yes:
+            # One non-modal prompt at a time so attack bursts never freeze the UI
+            if self._pending_switch_dialog is not None:
                 return
+            if time.monotonic() - self._switch_prompt_closed_at < SWITCH_PROMPT_DEBOUNCE:
+                return
+            self._show_switch_prompt(backup_network)
+            return
         
-        # Enhanced network manager returns tuple (success, message)
-        if ENHANCED_MODE and hasattr(self.network_manager, 'connect_to_network'):
-            try:
-                success, message = self.network_manager.connect_to_network(backup_network)
-            except (TypeError, ValueError):
-                # Fallback for legacy manager
-                success = self.network_manager.connect_to_network(backup_network)
-                message = f"Connected to {backup_network}" if success else f"Failed to connect to {backup_network}"
-        else:
-            success = self.network_manager.connect_to_network(backup_network)
-            message = f"Connected to {backup_network}" if success else f"Failed to connect to {backup_network}"
+        self._switch_to_backup(backup_network)
+    
+    def _show_switch_prompt(self, backup_network):
+        """Ask whether to switch networks without blocking the event loop"""
+        dialog = QDialog(self, Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel(f"⚠️ Suspicious WiFi activity detected!\nSwitch to backup network '{backup_network}'?"))
+        
+        button_layout = QHBoxLayout()
+        switch_btn = QPushButton("Switch")
+        switch_btn.clicked.connect(dialog.accept)
+        dismiss_btn = QPushButton("Dismiss")
+        dismiss_btn.clicked.connect(dialog.reject)
+        button_layout.addWidget(switch_btn)
+        button_layout.addWidget(dismiss_btn)
+        layout.addLayout(button_layout)
         
+        dialog.accepted.connect(lambda: self._switch_to_backup(backup_network))
+        dialog.finished.connect(self._clear_switch_prompt)
+        self._pending_switch_dialog = dialog
+        dialog.show()
+    
+    def _clear_switch_prompt(self):
+        """Forget the closed switch prompt and start the debounce window"""
+        self._pending_switch_dialog = None
+        self._switch_prompt_closed_at = time.monotonic()
+    
+    def _start_worker(self, name, on_result, fn, *args):
+        """Run fn(*args) on a background thread, unless the named task is still running"""
+        worker = self._workers.get(name)
+        if worker is not None and worker.isRunning():
+            return None
+        
+        worker = self._workers[name] = CallableWorker(fn, *args)
+        worker.result.connect(on_result)
+        return worker
+    
+    def _switch_to_backup(self, backup_network):
+        """Connect to the backup network on a background thread"""
+        worker = self._start_worker('network_switch', self._report_network_switch,
+                                    self._connect_to_backup, backup_network)
+        if worker is not None:
+            worker.start()
+    
+    def _connect_to_backup(self, profile_name):
+        """Connect to a network and return (success, message); runs on a worker thread"""
+        result = self.network_manager.connect_to_network(profile_name)
+        # Enhanced network manager returns tuple (success, message), legacy a bool
+        if isinstance(result, tuple):
+            return result
+        return result, f"Connected to {profile_name}" if result else f"Failed to connect to {profile_name}"
+    
+    def _report_network_switch(self, result):
+        """Log and show the outcome of a backup network switch"""
+        success, message = result
         self.log_message(f"Network switch attempt: {message}")
         if success:
             QMessageBox.information(self, "Network Switch", message)
         else:
             QMessageBox.warning(self, "Network Switch Failed", message)
     
-    def refresh_network_list(self):
-        """Refresh the list of available networks"""
-        profiles = self.network_manager.get_available_profiles()
+    def refresh_network_list(self, force=False):
+        """Refresh the list of available networks on a background thread"""
+        worker = self._start_worker('profiles', self._populate_network_list,
+                                    self.network_manager.get_available_profiles, force)
+        if worker is None:
+            return
+        
+        self.refresh_networks_btn.setEnabled(False)
+        worker.finished.connect(lambda: self.refresh_networks_btn.setEnabled(True))
+        worker.start()
+    
+    def _populate_network_list(self, profiles):
+        """Fill the backup network list, keeping whatever is already entered"""
+        current = self.backup_network_combo.currentText()
         self.backup_network_combo.clear()
         self.backup_network_combo.addItems(profiles)
+        if current:
+            index = self.backup_network_combo.findText(current)
+            if index >= 0:
+                self.backup_network_combo.setCurrentIndex(index)
+            else:
+                self.backup_network_combo.setEditText(current)
+    
+    def closeEvent(self, event):
+        """Flush the log when the window is hidden to the tray"""
+        self._flush_log()
+        super().closeEvent(event)
+    
+    def wait_for_workers(self):
+        """Let running background threads finish; called once the app is quitting"""
+        for worker in self._workers.values():
+            worker.wait()
     
     def test_discord_webhook(self):
         """Test Discord webhook"""
@@ -616,9 +915,25 @@ class WiFiDeauthDetectorGUI(QMainWindow):
             QMessageBox.warning(self, "Error", "Please enter a webhook URL")
             return
         
-        webhook = DiscordWebhook(webhook_url)
-        success = webhook.send_alert("TEST:MAC", "TEST:TARGET", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        # Reuse the live webhook unless the URL in the field hasn't been saved yet
+        if webhook_url == self.discord_webhook.webhook_url:
+            webhook = self.discord_webhook
+        else:
+            webhook = DiscordWebhook(webhook_url)
+        
+        # The POST can take up to its timeout, so keep it off the GUI thread
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        worker = self._start_worker('webhook_test', self._report_webhook_test,
+                                    webhook.send_alert, "TEST:MAC", "TEST:TARGET", timestamp)
+        if worker is None:
+            return
         
+        self.test_discord_btn.setEnabled(False)
+        worker.finished.connect(lambda: self.test_discord_btn.setEnabled(True))
+        worker.start()
+    
+    def _report_webhook_test(self, success):
+        """Show the outcome of a test webhook"""
         if success:
             QMessageBox.information(self, "Success", "Test webhook sent successfully!")
         else:
@@ -654,27 +969,62 @@ class WiFiDeauthDetectorGUI(QMainWindow):
         self.settings.set("log_attacks", self.logging_cb.isChecked())
         self.settings.set("demo_mode", self.demo_mode_cb.isChecked())
         
+        self._cache_alert_settings()
+        
         if self.settings.save_settings():
+            # The tray shows the saved demo mode, so it only changes once the save succeeds
+            self._update_tray_mode()
             QMessageBox.information(self, "Success", "Settings saved successfully!\nRestart the application for demo mode changes to take effect.")
         else:
             QMessageBox.warning(self, "Error", "Failed to save settings")
         
-        # Update Discord webhook instance
-        self.discord_webhook = DiscordWebhook(self.settings.get("discord_webhook"))
+        # Update Discord webhook instance only when the URL changed
+        webhook_url = self.settings.get("discord_webhook")
+        if webhook_url != self.discord_webhook.webhook_url:
+            self.discord_webhook = DiscordWebhook(webhook_url)
+    
+    def _cache_alert_settings(self):
+        """Snapshot the per-alert toggles so detections skip the settings lookups"""
+        self._log_attacks = self.settings.get("log_attacks")
+        self._notifications_enabled = self.settings.get("notifications_enabled")
+        self._discord_enabled = self.settings.get("discord_enabled")
+        self._auto_switch_enabled = self.settings.get("auto_switch_enabled")
     
     def log_message(self, message):
         """Add message to log display"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _log_timestamp()
         log_entry = f"[{timestamp}] {message}"
         self.log_display.append(log_entry)
         
         # Also save to file if logging enabled
-        if self.settings.get("log_attacks"):
+        if self._log_attacks:
+            try:
+                # Keep one buffered handle instead of reopening per line
+                if self._log_file is None:
+                    self._log_file = open("deauth_log.txt", "a", buffering=LOG_BUFFER_SIZE, encoding="utf-8")
+                self._log_file.write(log_entry + "\n")
+            except Exception as e:
+                print(f"Error writing to log file: {e}")
+                self._log_file = None
+    
+    def close_log(self):
+        """Flush and close the log file; called once the app is quitting"""
+        self._log_flush_timer.stop()
+        if self._log_file is not None:
+            try:
+                self._log_file.close()
+            except Exception as e:
+                print(f"Error writing to log file: {e}")
+            self._log_file = None
+    
+    def _flush_log(self):
+        """Push buffered log lines to disk"""
+        if self._log_file is not None:
             try:
-                with open("deauth_log.txt", "a") as f:
-                    f.write(log_entry + "\n")
+                self._log_file.flush()
             except Exception as e:
                 print(f"Error writing to log file: {e}")
+                self._log_file = None
     
     def clear_logs(self):
         """Clear log display"""
@@ -698,9 +1048,12 @@ def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)  # Keep running in system tray
+    app.aboutToQuit.connect(shutdown_alert_delivery)
     
     # Create and show main window
     window = WiFiDeauthDetectorGUI()
+    app.aboutToQuit.connect(window.wait_for_workers)
+    app.aboutToQuit.connect(window.close_log)
     window.show()
     
     sys.exit(app.exec_())
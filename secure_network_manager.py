@@ -4,17 +4,127 @@ Secure Network Manager v2.1
 Enhanced security with input validation and safe command execution
 """
 
+import os
 import subprocess
 import re
 import logging
+import queue
 import shlex
+import threading
 import time
+from collections import deque
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 
+import wlan_api
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+PROFILE_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-_\.]+$')
+DANGEROUS_PROFILE_CHARS = (';', '&', '|', '`', '$', '(', ')', '{', '}', '<', '>', '"', "'")
+
+# Spawn netsh without allocating a console window on Windows
+NETSH_SPAWN_KWARGS = {}
+if os.name == 'nt':
+    _startupinfo = subprocess.STARTUPINFO()
+    _startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _startupinfo.wShowWindow = 0  # SW_HIDE
+    NETSH_SPAWN_KWARGS = {'startupinfo': _startupinfo, 'creationflags': subprocess.CREATE_NO_WINDOW}
+
+
+@lru_cache(maxsize=1024)
+def _check_profile_name(profile_name: str, max_length: int) -> Tuple[Optional[str], Optional[str]]:
+    """Validate a profile name; returns (sanitized name, None) or (None, problem)"""
+    # Remove leading/trailing whitespace
+    profile_name = profile_name.strip()
+    
+    # Check length
+    if len(profile_name) > max_length:
+        return None, f"Profile name too long: {len(profile_name)} chars (max: {max_length})"
+    
+    # Check for allowed characters only
+    if not PROFILE_NAME_RE.match(profile_name):
+        return None, f"Profile name contains invalid characters: {profile_name}"
+    
+    # Additional security: remove any potential command injection patterns
+    for pattern in DANGEROUS_PROFILE_CHARS:
+        if pattern in profile_name:
+            return None, f"Profile name contains dangerous character '{pattern}': {profile_name}"
+    
+    return profile_name, None
+
+
+class NetshSession:
+    """Long-lived interactive netsh process used for read-only queries"""
+    
+    # Unknown commands are echoed back by netsh, which marks the end of output
+    SENTINEL = "---END---"
+    
+    def __init__(self):
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+    
+    def _start(self):
+        """Launch netsh in interactive mode reading commands from stdin"""
+        self._process = subprocess.Popen(
+            ['netsh'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            **NETSH_SPAWN_KWARGS
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read_output, args=(self._process, self._lines), daemon=True).start()
+    
+    @staticmethod
+    def _read_output(process, lines):
+        """Forward netsh stdout lines to the queue until the process exits"""
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+    
+    def run(self, command: str, timeout: int) -> Optional[str]:
+        """Run a netsh command and return its output, or None if the session failed"""
+        with self._lock:
+            try:
+                if self._process is None or self._process.poll() is not None:
+                    self._start()
+                
+                self._process.stdin.write(f"{command}\n{self.SENTINEL}\n")
+                self._process.stdin.flush()
+                
+                deadline = time.monotonic() + timeout
+                output = []
+                while True:
+                    line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+                    if line is None:
+                        raise OSError("netsh session exited")
+                    if self.SENTINEL in line:
+                        break
+                    output.append(line)
+                
+                # Drop interactive prompts echoed before the command output
+                return ''.join(output).replace('netsh>', '')
+                
+            except (OSError, ValueError, queue.Empty) as e:
+                logger.warning(f"netsh session unavailable, falling back to subprocess: {e}")
+                self.close()
+                return None
+    
+    def close(self):
+        """Terminate the netsh process"""
+        if self._process is not None:
+            try:
+                self._process.kill()
+            except OSError:
+                pass
+            self._process = None
+
 
 class SecureNetworkManager:
     """Enhanced network manager with security improvements"""
@@ -22,8 +132,15 @@ class SecureNetworkManager:
     def __init__(self):
         self.command_timeout = 10
         self.max_profile_name_length = 32
-        self.allowed_profile_chars = re.compile(r'^[a-zA-Z0-9\s\-_\.]+$')
-        self.command_history = []  # For audit trail
+        self.allowed_profile_chars = PROFILE_NAME_RE
+        self.max_command_history = 100
+        self.command_history = deque(maxlen=self.max_command_history)  # For audit trail
+        self._netsh_session = NetshSession() if os.name == 'nt' else None
+        
+        # Saved profiles change on the scale of minutes, so cache the list briefly
+        self.profile_cache_ttl = 30
+        self._profiles_cache = None
+        self._profiles_ts = 0.0
         
     def _sanitize_profile_name(self, profile_name: str) -> Optional[str]:
         """Sanitize and validate WiFi profile names to prevent command injection"""
@@ -31,27 +148,23 @@ class SecureNetworkManager:
             logger.warning("Invalid profile name: empty or not string")
             return None
             
-        # Remove leading/trailing whitespace
-        profile_name = profile_name.strip()
-        
-        # Check length
-        if len(profile_name) > self.max_profile_name_length:
-            logger.warning(f"Profile name too long: {len(profile_name)} chars (max: {self.max_profile_name_length})")
-            return None
-            
-        # Check for allowed characters only
-        if not self.allowed_profile_chars.match(profile_name):
-            logger.warning(f"Profile name contains invalid characters: {profile_name}")
-            return None
-            
-        # Additional security: remove any potential command injection patterns
-        dangerous_patterns = [';', '&', '|', '`', '$', '(', ')', '{', '}', '<', '>', '"', "'"]
-        for pattern in dangerous_patterns:
-            if pattern in profile_name:
-                logger.warning(f"Profile name contains dangerous character '{pattern}': {profile_name}")
-                return None
-                
-        return profile_name
+        # Validation is a pure function of the name, so repeated names hit the cache
+        safe_name, problem = _check_profile_name(profile_name, self.max_profile_name_length)
+        if problem:
+            logger.warning(problem)
+        return safe_name
+    
+    def _record_command(self, command_str: str):
+        """Append a command to the bounded audit trail"""
+        # The deque drops the oldest entry itself once it is full
+        timestamp = datetime.now()
+        self.command_history.append({
+            'timestamp': timestamp,
+            # Formatted once here so get_command_history doesn't strftime per call
+            'timestamp_str': timestamp.isoformat(sep=' ', timespec='seconds'),
+            'command': command_str,
+            'sanitized': True
+        })
     
     def _execute_safe_command(self, command: List[str], timeout: int = None) -> Tuple[bool, str, str]:
         """Execute command safely with timeout and logging"""
@@ -60,15 +173,7 @@ class SecureNetworkManager:
             
         # Log command for audit trail
         command_str = ' '.join(command)
-        self.command_history.append({
-            'timestamp': datetime.now(),
-            'command': command_str,
-            'sanitized': True
-        })
-        
-        # Keep only recent history
-        if len(self.command_history) > 100:
-            self.command_history = self.command_history[-50:]
+        self._record_command(command_str)
         
         try:
             logger.debug(f"Executing command: {command_str}")
@@ -104,47 +209,92 @@ class SecureNetworkManager:
             logger.error(f"Error executing command '{command_str}': {e}")
             return False, "", str(e)
     
-    def get_available_profiles(self) -> List[str]:
-        """Get list of available WiFi profiles with enhanced security"""
+    def _execute_netsh_query(self, command: List[str], timeout: int = None) -> Tuple[bool, str, str]:
+        """Execute a read-only netsh query through the persistent session when available"""
+        if self._netsh_session is None:
+            return self._execute_safe_command(command, timeout)
+        
+        if timeout is None:
+            timeout = self.command_timeout
+        
+        command_str = ' '.join(command)
+        output = self._netsh_session.run(' '.join(command[1:]), timeout)
+        if output is None:
+            return self._execute_safe_command(command, timeout)
+        
+        self._record_command(command_str)
+        
+        return True, output.strip(), ""
+    
+    def close(self):
+        """Release the persistent netsh session"""
+        if self._netsh_session is not None:
+            self._netsh_session.close()
+    
+    def invalidate_profile_cache(self):
+        """Force the next get_available_profiles call to query netsh"""
+        self._profiles_cache = None
+    
+    def get_available_profiles(self, force: bool = False) -> List[str]:
+        """Get list of available WiFi profiles; force skips the cached list"""
+        if (not force and self._profiles_cache is not None and
+                time.monotonic() - self._profiles_ts < self.profile_cache_ttl):
+            return list(self._profiles_cache)
+        
         try:
-            success, stdout, stderr = self._execute_safe_command([
-                'netsh', 'wlan', 'show', 'profiles'
-            ])
-            
-            if not success:
-                logger.error(f"Failed to get WiFi profiles: {stderr}")
-                return []
-            
-            profiles = []
-            lines = stdout.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if 'All User Profile' in line and ':' in line:
-                    try:
-                        # Extract profile name safely
-                        parts = line.split(':', 1)
-                        if len(parts) == 2:
-                            profile_name = parts[1].strip()
-                            
-                            # Sanitize the extracted profile name
-                            sanitized_name = self._sanitize_profile_name(profile_name)
-                            if sanitized_name:
-                                profiles.append(sanitized_name)
-                            else:
-                                logger.warning(f"Skipping invalid profile: {profile_name}")
-                                
-                    except Exception as e:
-                        logger.warning(f"Error parsing profile line '{line}': {e}")
-                        continue
+            # One in-process wlanapi.dll call where available, netsh otherwise
+            names = wlan_api.list_profiles()
+            if names is not None:
+                profiles = [name for name in map(self._sanitize_profile_name, names) if name]
+            else:
+                profiles = self._query_netsh_profiles()
+                if profiles is None:
+                    return []
             
             logger.info(f"Found {len(profiles)} valid WiFi profiles")
-            return profiles
+            self._profiles_cache = profiles
+            self._profiles_ts = time.monotonic()
+            return list(profiles)
             
         except Exception as e:
             logger.error(f"Error getting WiFi profiles: {e}")
             return []
     
+    def _query_netsh_profiles(self) -> Optional[List[str]]:
+        """Parse saved profile names from netsh, or None if the query failed"""
+        success, stdout, stderr = self._execute_netsh_query([
+            'netsh', 'wlan', 'show', 'profiles'
+        ])
+        
+        if not success:
+            logger.error(f"Failed to get WiFi profiles: {stderr}")
+            return None
+        
+        profiles = []
+        lines = stdout.split('\n')
+        
+        for line in lines:
+            line = line.strip()
+            if 'All User Profile' in line and ':' in line:
+                try:
+                    # Extract profile name safely
+                    parts = line.split(':', 1)
+                    if len(parts) == 2:
+                        profile_name = parts[1].strip()
+                        
+                        # Sanitize the extracted profile name
+                        sanitized_name = self._sanitize_profile_name(profile_name)
+                        if sanitized_name:
+                            profiles.append(sanitized_name)
+                        else:
+                            logger.warning(f"Skipping invalid profile: {profile_name}")
+                            
+                except Exception as e:
+                    logger.warning(f"Error parsing profile line '{line}': {e}")
+                    continue
+        
+        return profiles
+    
     def connect_to_network(self, profile_name: str) -> Tuple[bool, str]:
         """Connect to a specific WiFi network with enhanced security and feedback"""
         # Sanitize input
@@ -166,6 +316,7 @@ class SecureNetworkManager:
                 # Verify connection was actually established
                 connection_verified = self._verify_connection(safe_profile_name)
                 if connection_verified:
+                    self.invalidate_profile_cache()
                     logger.info(f"Successfully connected to {safe_profile_name}")
                     return True, f"Connected to {safe_profile_name}"
                 else:
@@ -187,7 +338,7 @@ class SecureNetworkManager:
             start_time = time.time()
             
             while time.time() - start_time < max_wait_time:
-                success, stdout, _ = self._execute_safe_command([
+                success, stdout, _ = self._execute_netsh_query([
                     'netsh', 'wlan', 'show', 'interfaces'
                 ], timeout=5)
                 
@@ -224,7 +375,7 @@ class SecureNetworkManager:
     def get_current_connection_info(self) -> Dict[str, any]:
         """Get detailed information about current connection"""
         try:
-            success, stdout, stderr = self._execute_safe_command([
+            success, stdout, stderr = self._execute_netsh_query([
                 'netsh', 'wlan', 'show', 'interfaces'
             ])
             
@@ -336,7 +487,7 @@ class SecureNetworkManager:
     def get_available_networks(self) -> List[Dict[str, any]]:
         """Get list of available networks with signal strength and security info"""
         try:
-            success, stdout, stderr = self._execute_safe_command([
+            success, stdout, stderr = self._execute_netsh_query([
                 'netsh', 'wlan', 'show', 'profiles'
             ])
             
@@ -394,11 +545,11 @@ class SecureNetworkManager:
         # Return only sanitized history (no sensitive data)
         return [
             {
-                'timestamp': entry['timestamp'].strftime("%Y-%m-%d %H:%M:%S"),
+                'timestamp': entry['timestamp_str'],
                 'command_type': entry['command'].split()[0] if entry['command'] else 'Unknown',
                 'sanitized': entry['sanitized']
             }
-            for entry in self.command_history[-20:]  # Last 20 commands
+            for entry in list(self.command_history)[-20:]  # Last 20 commands
         ]
     
     def validate_network_security(self, profile_name: str) -> Dict[str, any]:
@@ -482,9 +633,9 @@ class NetworkManager:
         self.secure_manager = SecureNetworkManager()
         logger.warning("Using legacy NetworkManager. Consider upgrading to SecureNetworkManager.")
     
-    def get_available_profiles(self) -> List[str]:
+    def get_available_profiles(self, force: bool = False) -> List[str]:
         """Legacy method - get available profiles"""
-        return self.secure_manager.get_available_profiles()
+        return self.secure_manager.get_available_profiles(force)
     
     def connect_to_network(self, profile_name: str) -> bool:
         """Legacy method - connect to network (returns bool only)"""
@@ -5,19 +5,77 @@ Enhanced security with encryption for sensitive settings
 """
 
 import os
+import re
 import json
 import base64
 import hashlib
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# orjson is optional; it encodes straight to UTF-8 bytes for the cipher and settings file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+NETWORK_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-_\.]+$')
+
+
+# typed=True keeps e.g. True and 1 apart, which the boolean checks rely on
+@lru_cache(maxsize=256, typed=True)
+def _validate_setting(key: str, value: Any) -> tuple[bool, str]:
+    """Validate setting values for security and correctness"""
+    
+    # Discord webhook validation
+    if key == 'discord_webhook' and value:
+        if not isinstance(value, str):
+            return False, "Discord webhook must be a string"
+        if value and not value.startswith('https://discord.com/api/webhooks/'):
+            return False, "Invalid Discord webhook URL format"
+    
+    # Network name validation
+    elif key == 'backup_network' and value:
+        if not isinstance(value, str):
+            return False, "Network name must be a string"
+        if len(value) > 32:
+            return False, "Network name too long (max 32 characters)"
+        # Check for dangerous characters
+        if not NETWORK_NAME_RE.match(value):
+            return False, "Network name contains invalid characters"
+    
+    # Numeric validations
+    elif key in ['max_threat_score', 'connection_timeout', 'monitoring_interval']:
+        if not isinstance(value, (int, float)):
+            return False, f"{key} must be a number"
+        if value < 0:
+            return False, f"{key} must be positive"
+    
+    # Boolean validations
+    elif key in ['discord_enabled', 'auto_switch_enabled', 'auto_switch_confirm', 
+                'notifications_enabled', 'log_attacks', 'demo_mode']:
+        if not isinstance(value, bool):
+            return False, f"{key} must be true or false"
+    
+    # Security level validation
+    elif key == 'security_level':
+        if value not in ['low', 'medium', 'high', 'paranoid']:
+            return False, "Security level must be low, medium, high, or paranoid"
+    
+    # Log level validation
+    elif key == 'log_level':
+        if value not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
+            return False, "Invalid log level"
+    
+    return True, "Valid"
+
 
 class SecureSettingsManager:
     """Enhanced settings manager with encryption for sensitive data"""
@@ -54,8 +112,11 @@ class SecureSettingsManager:
             "pattern_analysis_interval": 15
         }
         
-        self.settings = self.load_settings()
+        # Must exist before load_settings, which decrypts with it; the key is
+        # derived (PBKDF2) once on first use and the Fernet instance reused
         self._cipher_suite = None
+        self._saved_settings = None
+        self.settings = self.load_settings()
         
     def _get_machine_key(self) -> bytes:
         """Generate a machine-specific key for encryption"""
@@ -126,49 +187,11 @@ class SecureSettingsManager:
     
     def _validate_setting_value(self, key: str, value: Any) -> tuple[bool, str]:
         """Validate setting values for security and correctness"""
-        
-        # Discord webhook validation
-        if key == 'discord_webhook' and value:
-            if not isinstance(value, str):
-                return False, "Discord webhook must be a string"
-            if value and not value.startswith('https://discord.com/api/webhooks/'):
-                return False, "Invalid Discord webhook URL format"
-        
-        # Network name validation
-        elif key == 'backup_network' and value:
-            if not isinstance(value, str):
-                return False, "Network name must be a string"
-            if len(value) > 32:
-                return False, "Network name too long (max 32 characters)"
-            # Check for dangerous characters
-            import re
-            if not re.match(r'^[a-zA-Z0-9\s\-_\.]+$', value):
-                return False, "Network name contains invalid characters"
-        
-        # Numeric validations
-        elif key in ['max_threat_score', 'connection_timeout', 'monitoring_interval']:
-            if not isinstance(value, (int, float)):
-                return False, f"{key} must be a number"
-            if value < 0:
-                return False, f"{key} must be positive"
-        
-        # Boolean validations
-        elif key in ['discord_enabled', 'auto_switch_enabled', 'auto_switch_confirm', 
-                    'notifications_enabled', 'log_attacks', 'demo_mode']:
-            if not isinstance(value, bool):
-                return False, f"{key} must be true or false"
-        
-        # Security level validation
-        elif key == 'security_level':
-            if value not in ['low', 'medium', 'high', 'paranoid']:
-                return False, "Security level must be low, medium, high, or paranoid"
-        
-        # Log level validation
-        elif key == 'log_level':
-            if value not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
-                return False, "Invalid log level"
-        
-        return True, "Valid"
+        try:
+            return _validate_setting(key, value)
+        except TypeError:
+            # Unhashable values can't be cached; validate them directly
+            return _validate_setting.__wrapped__(key, value)
     
     def load_settings(self) -> Dict[str, Any]:
         """Load settings with security validation"""
@@ -194,6 +217,7 @@ class SecureSettingsManager:
                         validated_settings[key] = self.default_settings[key]
             
             logger.info("Settings loaded successfully")
+            self._saved_settings = validated_settings.copy()
             return validated_settings
             
         except Exception as e:
@@ -209,7 +233,7 @@ class SecureSettingsManager:
             cipher_suite = self._get_cipher_suite()
             decrypted_data = cipher_suite.decrypt(encrypted_data)
             
-            settings_data = json.loads(decrypted_data.decode())
+            settings_data = orjson.loads(decrypted_data) if orjson else json.loads(decrypted_data.decode())
             logger.debug("Loaded encrypted settings")
             return settings_data
             
@@ -220,8 +244,9 @@ class SecureSettingsManager:
     def _load_regular_settings(self) -> Dict[str, Any]:
         """Load settings from regular JSON file"""
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                settings_data = json.load(f)
+            with open(self.settings_file, 'rb') as f:
+                data = f.read()
+            settings_data = orjson.loads(data) if orjson else json.loads(data)
             
             # Decrypt sensitive values if they appear to be encrypted
             for key, value in settings_data.items():
@@ -237,6 +262,13 @@ class SecureSettingsManager:
     
     def save_settings(self) -> bool:
         """Save settings with encryption for sensitive data"""
+        # Nothing changed since the last load/save: skip validation,
+        # encryption and the file write
+        target_file = self.encrypted_file if self.use_encryption else self.settings_file
+        if self.settings == self._saved_settings and os.path.exists(target_file):
+            logger.debug("Settings unchanged, skipping save")
+            return True
+        
         try:
             # Validate all settings before saving
             for key, value in self.settings.items():
@@ -251,6 +283,8 @@ class SecureSettingsManager:
             if self.use_encryption:
                 # Save to encrypted file
                 success = self._save_encrypted_settings(settings_to_save)
+                if success:
+                    self._saved_settings = settings_to_save
                 
                 # Remove old unencrypted file if encryption succeeded
                 if success and os.path.exists(self.settings_file):
@@ -267,7 +301,10 @@ class SecureSettingsManager:
                     if key in self.sensitive_keys and isinstance(value, str) and value:
                         settings_to_save[key] = self._encrypt_value(value)
                 
-                return self._save_regular_settings(settings_to_save)
+                success = self._save_regular_settings(settings_to_save)
+                if success:
+                    self._saved_settings = self.settings.copy()
+                return success
             
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
@@ -276,12 +313,16 @@ class SecureSettingsManager:
     def _save_encrypted_settings(self, settings_data: Dict[str, Any]) -> bool:
         """Save settings to encrypted file"""
         try:
-            # Convert to JSON
-            json_data = json.dumps(settings_data, indent=2, ensure_ascii=False)
+            # Convert to compact JSON bytes; the file is never read by humans,
+            # so indentation would only add bytes to encrypt
+            if orjson:
+                json_data = orjson.dumps(settings_data)
+            else:
+                json_data = json.dumps(settings_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
             
             # Encrypt the entire JSON
             cipher_suite = self._get_cipher_suite()
-            encrypted_data = cipher_suite.encrypt(json_data.encode('utf-8'))
+            encrypted_data = cipher_suite.encrypt(json_data)
             
             # Write to file
             with open(self.encrypted_file, 'wb') as f:
@@ -303,8 +344,12 @@ class SecureSettingsManager:
     def _save_regular_settings(self, settings_data: Dict[str, Any]) -> bool:
         """Save settings to regular JSON file"""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings_data, f, indent=2, ensure_ascii=False)
+            if orjson:
+                json_data = orjson.dumps(settings_data, option=orjson.OPT_INDENT_2)
+            else:
+                json_data = json.dumps(settings_data, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(self.settings_file, 'wb') as f:
+                f.write(json_data)
             
             # Set restrictive file permissions
             try:
@@ -320,14 +365,8 @@ class SecureSettingsManager:
             return False
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get setting value with automatic decryption for sensitive keys"""
-        value = self.settings.get(key, default)
-        
-        # Decrypt sensitive values if needed
-        if key in self.sensitive_keys and isinstance(value, str) and value:
-            return self._decrypt_value(value)
-        
-        return value
+        """Get setting value (sensitive values are decrypted once at load)"""
+        return self.settings.get(key, default)
     
     def set(self, key: str, value: Any) -> bool:
         """Set setting value with validation"""
@@ -11,9 +11,10 @@ License: MIT
 """
 
 import sys
+import time
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QTableWidget, QTableWidgetItem, QComboBox,
@@ -26,6 +27,29 @@ from sniffer import WiFiSniffer
 from utils import send_notification
 
 
+# Last formatted second, reused while a burst of alerts lands in the same second
+_last_sec = None
+_last_clock = ''
+
+
+def format_clock(timestamp: Optional[float] = None) -> str:
+    """
+    Format a Unix timestamp as HH:MM:SS, reusing the string within a second.
+    
+    Args:
+        timestamp: Unix timestamp. If None, uses the current time.
+        
+    Returns:
+        Local time formatted as HH:MM:SS.
+    """
+    global _last_sec, _last_clock
+    sec = int(time.time() if timestamp is None else timestamp)
+    if sec != _last_sec:
+        _last_clock = time.strftime('%H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return _last_clock
+
+
 class SnifferThread(QThread):
     """Thread for running the WiFi sniffer in background."""
     
@@ -255,7 +279,7 @@ class DeauthDetectorGUI(QMainWindow):
         row = self.attack_table.rowCount()
         self.attack_table.insertRow(row)
         
-        timestamp = datetime.fromtimestamp(attack_info['timestamp']).strftime('%H:%M:%S')
+        timestamp = format_clock(attack_info['timestamp'])
         
         self.attack_table.setItem(row, 0, QTableWidgetItem(timestamp))
         self.attack_table.setItem(row, 1, QTableWidgetItem(attack_info['type'].upper()))
@@ -298,7 +322,7 @@ class DeauthDetectorGUI(QMainWindow):
             
     def log_message(self, message: str):
         """Add a message to the console output."""
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = format_clock()
         formatted_message = f"[{timestamp}] {message}"
         self.console_output.append(formatted_message)
         self.logger.info(message)
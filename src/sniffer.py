@@ -10,10 +10,65 @@ License: MIT
 """
 
 import logging
+import struct
 import threading
+import time
 from typing import Callable, Optional
-from scapy.all import sniff, Dot11, Dot11Deauth, Dot11Disas
+# Import only the 802.11 layers instead of scapy.all, which pulls in every
+# protocol layer (IPv6, TLS, DHCP, ...) and roughly triples import time
+from scapy.config import conf
 from scapy.error import Scapy_Exception
+from scapy.layers.dot11 import RadioTap
+
+
+# Kernel-side BPF filter: only deauth/disassoc frames are copied into Python
+DEAUTH_BPF_FILTER = "type mgt subtype deauth or type mgt subtype disassoc"
+
+# 802.11 management frame subtypes
+SUBTYPE_DISASSOC = 10
+SUBTYPE_DEAUTH = 12
+
+FRAME_TYPES = {
+    SUBTYPE_DEAUTH: 'deauth',
+    SUBTYPE_DISASSOC: 'disassoc',
+}
+
+# Deauth/disassoc header: frame control, duration, addr1-3, sequence, reason
+DOT11_MGMT_HEADER = struct.Struct('<B3x6s6s6s2xH')
+
+# Bytes read per frame; RadioTap plus the 26-byte header fit well within this
+CAPTURE_LEN = 256
+
+
+def parse_raw_frame(buf: bytes, has_radiotap: bool = True) -> Optional[dict]:
+    """
+    Parse a raw deauth/disassoc frame without Scapy dissection.
+    
+    Args:
+        buf: Raw frame bytes as captured on the interface.
+        has_radiotap: Whether the frame starts with a RadioTap header.
+        
+    Returns:
+        Dictionary with frame details, or None if not a deauth/disassoc frame.
+    """
+    # RadioTap header length is a little-endian u16 at bytes 2-3
+    offset = int.from_bytes(buf[2:4], 'little') if has_radiotap else 0
+    if len(buf) < offset + DOT11_MGMT_HEADER.size:
+        return None
+    
+    frame_control, addr1, addr2, addr3, reason = DOT11_MGMT_HEADER.unpack_from(buf, offset)
+    frame_type = (frame_control >> 2) & 0x3
+    subtype = frame_control >> 4
+    if frame_type != 0 or subtype not in FRAME_TYPES:
+        return None
+    
+    return {
+        'type': FRAME_TYPES[subtype],
+        'attacker_mac': addr2.hex(':'),
+        'target_mac': addr1.hex(':'),
+        'bssid': addr3.hex(':'),
+        'reason_code': reason,
+    }
 
 
 class WiFiSniffer:
@@ -41,84 +96,28 @@ class WiFiSniffer:
         """
         self.packet_callback = callback
         
-    def _packet_handler(self, packet):
+    def _handle_raw_frame(self, buf: bytes, has_radiotap: bool, timestamp: float):
         """
-        Handle incoming packets and filter for deauth/disassoc frames.
+        Handle a raw captured frame on the fast path (no Scapy dissection).
         
         Args:
-            packet: The captured packet from Scapy.
+            buf: Raw frame bytes.
+            has_radiotap: Whether the frame starts with a RadioTap header.
+            timestamp: Capture timestamp.
         """
         try:
-            # Check if packet contains 802.11 frame
-            if not packet.haslayer(Dot11):
+            attack_info = parse_raw_frame(buf, has_radiotap)
+            if attack_info is None:
                 return
-                
-            # Check for deauthentication frames
-            if packet.haslayer(Dot11Deauth):
-                self._handle_deauth_packet(packet)
-                
-            # Check for disassociation frames  
-            elif packet.haslayer(Dot11Disas):
-                self._handle_disassoc_packet(packet)
-                
-        except Exception as e:
-            self.logger.error(f"Error processing packet: {e}")
-            
-    def _handle_deauth_packet(self, packet):
-        """
-        Process deauthentication packets.
-        
-        Args:
-            packet: The deauth packet to process.
-        """
-        try:
-            dot11 = packet.getlayer(Dot11)
-            deauth = packet.getlayer(Dot11Deauth)
-            
-            attack_info = {
-                'type': 'deauth',
-                'attacker_mac': dot11.addr2,
-                'target_mac': dot11.addr1,
-                'bssid': dot11.addr3,
-                'reason_code': deauth.reason,
-                'timestamp': packet.time
-            }
-            
-            self.logger.warning(f"Deauth attack detected: {attack_info}")
-            
-            if self.packet_callback:
-                self.packet_callback(attack_info)
-                
-        except Exception as e:
-            self.logger.error(f"Error handling deauth packet: {e}")
-            
-    def _handle_disassoc_packet(self, packet):
-        """
-        Process disassociation packets.
-        
-        Args:
-            packet: The disassoc packet to process.
-        """
-        try:
-            dot11 = packet.getlayer(Dot11)
-            disassoc = packet.getlayer(Dot11Disas)
-            
-            attack_info = {
-                'type': 'disassoc',
-                'attacker_mac': dot11.addr2,
-                'target_mac': dot11.addr1,
-                'bssid': dot11.addr3,
-                'reason_code': disassoc.reason,
-                'timestamp': packet.time
-            }
+            attack_info['timestamp'] = timestamp
             
-            self.logger.warning(f"Disassoc attack detected: {attack_info}")
+            self.logger.warning(f"{attack_info['type'].capitalize()} attack detected: {attack_info}")
             
             if self.packet_callback:
                 self.packet_callback(attack_info)
                 
         except Exception as e:
-            self.logger.error(f"Error handling disassoc packet: {e}")
+            self.logger.error(f"Error processing raw frame: {e}")
             
     def start_sniffing(self):
         """Start the packet sniffing process."""
@@ -131,13 +130,17 @@ class WiFiSniffer:
         
         def sniff_worker():
             try:
-                sniff(
-                    iface=self.interface,
-                    prn=self._packet_handler,
-                    filter="type mgt subtype 12",  # Deauth frames
-                    store=0,
-                    stop_filter=lambda x: not self.is_running
-                )
+                # Read raw frames from a BPF-filtered socket and parse the
+                # header bytes directly instead of running Scapy's dissector
+                sock = conf.L2listen(iface=self.interface, filter=DEAUTH_BPF_FILTER)
+                try:
+                    while self.is_running:
+                        cls, buf, timestamp = sock.recv_raw(CAPTURE_LEN)
+                        if not buf:
+                            continue
+                        self._handle_raw_frame(buf, cls is RadioTap, timestamp or time.time())
+                finally:
+                    sock.close()
             except Scapy_Exception as e:
                 self.logger.error(f"Scapy sniffing error: {e}")
                 self.is_running = False
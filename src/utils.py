@@ -10,10 +10,12 @@ License: MIT
 """
 
 import os
+import re
 import sys
 import logging
 import platform
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -291,20 +293,24 @@ def get_system_info() -> dict:
     return info
 
 
+_MAC_HEX_RE = re.compile(r'^[0-9a-fA-F]{12}$')
+
+
+@lru_cache(maxsize=4096)
 def validate_mac_address(mac: str) -> bool:
     """
     Validate if a string is a valid MAC address.
     
+    Results are cached, since a flood of frames repeats the same few MACs.
+    
     Args:
         mac: MAC address string to validate.
         
     Returns:
         True if valid, False otherwise.
     """
-    import re
-    
     # Remove any separators
     clean_mac = mac.replace(':', '').replace('-', '').replace('.', '')
     
     # Check if it's 12 hex characters
-    return bool(re.match(r'^[0-9a-fA-F]{12}$', clean_mac))
\ No newline at end of file
+    return bool(_MAC_HEX_RE.match(clean_mac))
\ No newline at end of file
@@ -9,6 +9,8 @@ import sys
 import os
 import json
 import tempfile
+import random
+import time
 from unittest.mock import patch, MagicMock
 
 # Add the main directory to the path
@@ -16,6 +18,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from main import SettingsManager, NetworkManager, DiscordWebhook
 from windows_wifi_monitor import WindowsWiFiMonitor
+from secure_network_manager import SecureNetworkManager
+import enhanced_wifi_monitor
+from enhanced_wifi_monitor import (
+    DisconnectRing, EnhancedWiFiMonitor, SignalSpread, score_threat, interval_regularity
+)
 
 class TestSettingsManager(unittest.TestCase):
     """Test settings management functionality"""
@@ -27,8 +34,9 @@ class TestSettingsManager(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment"""
-        if os.path.exists(self.temp_file):
-            os.remove(self.temp_file)
+        for path in (self.temp_file, self.temp_file.replace('.json', '_secure.dat')):
+            if os.path.exists(path):
+                os.remove(path)
     
     def test_default_settings(self):
         """Test default settings are loaded correctly"""
@@ -98,6 +106,250 @@ class TestNetworkManager(unittest.TestCase):
         success = NetworkManager.connect_to_network("TestNetwork")
         self.assertFalse(success)
 
+class TestSecureNetworkManager(unittest.TestCase):
+    """Test secure network manager functionality"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.manager = SecureNetworkManager()
+    
+    @patch('subprocess.run')
+    def test_profiles_cached_within_ttl(self, mock_run):
+        """Test profile list is served from cache until invalidated"""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "    All User Profile     : Home Network\n"
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+        
+        self.assertEqual(self.manager.get_available_profiles(), ["Home Network"])
+        self.assertEqual(self.manager.get_available_profiles(), ["Home Network"])
+        self.assertEqual(mock_run.call_count, 1)
+        
+        self.manager.invalidate_profile_cache()
+        self.manager.get_available_profiles()
+        self.assertEqual(mock_run.call_count, 2)
+        
+        self.manager.get_available_profiles(force=True)
+        self.assertEqual(mock_run.call_count, 3)
+
+class TestThreatScoring(unittest.TestCase):
+    """Test the shared threat scoring function"""
+    
+    def test_score_threat_factors(self):
+        """Test each factor's contribution and the cap at 10"""
+        self.assertEqual(score_threat(1800, 25, 1, 14, False, 1), 0)
+        self.assertEqual(score_threat(60, 60, 0, 14, False, 0), 5)
+        self.assertEqual(score_threat(15, 85, 4, 2, True, 3), 10)
+    
+    def test_interval_regularity(self):
+        """Test mean interval and mean deviation of disconnect times"""
+        self.assertEqual(interval_regularity([100.0]), (0.0, 0.0))
+        self.assertEqual(interval_regularity([0.0, 60.0, 120.0, 180.0]), (60.0, 0.0))
+        mean, deviation = interval_regularity([0.0, 50.0, 120.0, 170.0])
+        self.assertAlmostEqual(mean, 170.0 / 3)
+        self.assertAlmostEqual(deviation, 80.0 / 9)
+
+class TestSignalSpread(unittest.TestCase):
+    """Test the sliding-window signal spread"""
+    
+    def test_spread_as_window_slides(self):
+        """Test extremes expire with their samples"""
+        spread = SignalSpread()
+        self.assertEqual(spread.spread(), 0)
+        for timestamp, signal in ((1.0, 50), (2.0, 90), (3.0, 70), (4.0, 20), (5.0, 60)):
+            spread.append(timestamp, signal)
+        self.assertEqual(len(spread), 5)
+        self.assertEqual(spread.spread(), 70)
+        
+        spread.expire(2.0)  # Drops the 90 maximum
+        self.assertEqual(len(spread), 3)
+        self.assertEqual(spread.spread(), 50)
+        
+        spread.expire(4.0)  # Drops the 20 minimum
+        self.assertEqual(len(spread), 1)
+        self.assertEqual(spread.spread(), 0)
+        
+        spread.append(6.0, 60)
+        spread.append(7.0, 35)
+        self.assertEqual(spread.spread(), 25)
+        
+        spread.expire(10.0)
+        self.assertEqual(len(spread), 0)
+        self.assertEqual(spread.spread(), 0)
+    
+    def test_spread_matches_window_scan(self):
+        """Test the spread against max - min over a rescanned window"""
+        rng = random.Random(7)
+        spread = SignalSpread()
+        samples = []
+        now = 0.0
+        for _ in range(2000):
+            now += rng.uniform(0.5, 10.0)
+            signal = rng.randint(0, 100)
+            samples.append((now, signal))
+            spread.append(now, signal)
+            spread.expire(now - 60)
+            window = [s for t, s in samples if t > now - 60]
+            self.assertEqual(len(spread), len(window))
+            self.assertEqual(spread.spread(), max(window) - min(window))
+
+class TestDisconnectRing(unittest.TestCase):
+    """Test the disconnect history ring buffer"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.ring = DisconnectRing(4)
+    
+    def _append(self, timestamp, reason="Normal signal disconnect"):
+        self.ring.append(timestamp, f"label-{timestamp:g}", 1, 50, 10.0, 6, "WPA2", 5, reason)
+    
+    def _newest_first(self, cutoff=None):
+        return [self.ring.timestamps[i] for i in self.ring.newest_first(cutoff)]
+    
+    def test_wraparound_overwrites_oldest(self):
+        """Test appends past capacity overwrite the oldest records"""
+        for timestamp in range(1, 7):
+            self._append(float(timestamp))
+        self.assertEqual(len(self.ring), 4)
+        self.assertEqual(self._newest_first(), [6.0, 5.0, 4.0, 3.0])
+        self.assertEqual(self.ring.newest_timestamp(), 6.0)
+        self.assertEqual([self.ring.labels[i] for i in self.ring.newest_first()],
+                         ["label-6", "label-5", "label-4", "label-3"])
+    
+    def test_pop_drops_newest(self):
+        """Test pop removes the newest record across the wrap point"""
+        for timestamp in range(1, 6):
+            self._append(float(timestamp))
+        self.ring.pop()
+        self.ring.pop()
+        self.assertEqual(self._newest_first(), [3.0, 2.0])
+        self.assertEqual(self.ring.newest_timestamp(), 3.0)
+        
+        self._append(7.0)
+        self.assertEqual(self._newest_first(), [7.0, 3.0, 2.0])
+        
+        for _ in range(3):
+            self.ring.pop()
+        self.assertEqual(len(self.ring), 0)
+        self.assertIsNone(self.ring.newest_timestamp())
+        self.assertRaises(IndexError, self.ring.pop)
+    
+    def test_trim_before_drops_oldest(self):
+        """Test trim_before removes records at or before the cutoff"""
+        for timestamp in range(1, 7):
+            self._append(float(timestamp))
+        self.ring.trim_before(4.0)
+        self.assertEqual(self._newest_first(), [6.0, 5.0])
+        self.ring.trim_before(0.0)
+        self.assertEqual(len(self.ring), 2)
+        self.ring.trim_before(10.0)
+        self.assertEqual(len(self.ring), 0)
+        self.assertEqual(self._newest_first(), [])
+    
+    def test_newest_first_stops_at_cutoff(self):
+        """Test newest_first yields only records after the cutoff"""
+        for timestamp in range(1, 7):
+            self._append(float(timestamp), reason=f"reason {timestamp % 2}")
+        self.assertEqual(self._newest_first(4.5), [6.0, 5.0])
+        self.assertEqual(self._newest_first(5.0), [6.0])
+        self.assertEqual(self._newest_first(6.0), [])
+        self.assertEqual([self.ring.strings[self.ring.reason_ids[i]] for i in self.ring.newest_first()],
+                         ["reason 0", "reason 1", "reason 0", "reason 1"])
+
+class TestEnhancedThreatInputs(unittest.TestCase):
+    """Test the monitor's rolling threat-scoring inputs"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        patcher = patch.object(enhanced_wifi_monitor, 'logger')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.monitor = EnhancedWiFiMonitor()
+    
+    def _disconnect(self, ssid, now, signal=50):
+        self.monitor._handle_enhanced_disconnect(
+            {'connected': False}, {'ssid': ssid, 'signal': signal}, 10, now=now
+        )
+    
+    def test_counts_after_rapid_disconnect_pops(self):
+        """Test per-SSID counts once a rapid burst is removed"""
+        monitor = self.monitor
+        self._disconnect('Home', 0.0)
+        self._disconnect('Office', 10.0)
+        self.assertEqual(monitor._recent_disconnect_counts(monitor._sid('Home'), 20.0), (2, 1))
+        self.assertEqual(monitor._recent_disconnect_counts(monitor._sid('Office'), 20.0), (2, 1))
+        
+        # Third disconnect in the window raises the rapid alert and pops all three
+        self._disconnect('Home', 20.0)
+        self.assertEqual(len(monitor.disconnect_history), 0)
+        self.assertEqual(monitor._recent_per_ssid, {})
+        self.assertEqual(monitor._recent_disconnect_counts(monitor._sid('Home'), 25.0), (0, 0))
+        
+        self._disconnect('Home', 30.0)
+        self.assertEqual(monitor._recent_disconnect_counts(monitor._sid('Home'), 35.0), (1, 1))
+        self.assertEqual(monitor._recent_disconnect_counts(monitor._sid('Office'), 35.0), (1, 0))
+        
+        # Expired entries leave the per-SSID counts too
+        self.assertEqual(monitor._recent_disconnect_counts(monitor._sid('Home'), 400.0), (0, 0))
+        self.assertEqual(monitor._recent_per_ssid, {})
+    
+    def test_recent_events_newest_first(self):
+        """Test get_recent_events lists the last hour newest first"""
+        now = time.monotonic()
+        self._disconnect('Home', now - 4000)
+        self._disconnect('Office', now - 100)
+        self._disconnect('Cafe', now - 50)
+        self.assertEqual([event['ssid'] for event in self.monitor.get_recent_events()],
+                         ['Cafe', 'Office'])
+    
+    def test_threat_inputs_match_history_scan(self):
+        """Test rolling inputs against a rescan of the full histories"""
+        monitor = self.monitor
+        history = monitor.disconnect_history
+        scored = []
+        
+        def calculate(duration, signal, recent_count, same_network, had_drop, hour):
+            scored.append((recent_count, same_network, had_drop))
+            return score_threat(duration, signal, recent_count, hour, had_drop, same_network)
+        monitor._calculate_threat_score = calculate
+        
+        rng = random.Random(42)
+        ssids = ['Home', 'Office', 'Cafe']
+        now = 0.0
+        for _ in range(300):
+            samples = []  # (time, ssid, signal) since the session started
+            for _ in range(rng.randint(5, 40)):
+                now += rng.uniform(1.0, 15.0)
+                ssid = rng.choice(ssids)
+                if rng.random() < 0.8:
+                    signal = rng.randint(1, 100)
+                    samples.append((now, ssid, signal))
+                    monitor._track_signal_changes(
+                        {'connected': True, 'ssid': ssid, 'signal': signal}, now=now
+                    )
+                    continue
+                
+                # Scan-based inputs, computed the way the history scan did
+                recent = [history.ssid_ids[i] for i in history.newest_first(now - 300)]
+                ssid_id = monitor._sid(ssid)
+                window = [s for t, name, s in samples if name == ssid and t > now - 120]
+                expected = (
+                    len(recent),
+                    recent.count(ssid_id),
+                    len(window) >= 5 and max(window) - min(window) > monitor.signal_drop_threshold
+                )
+                
+                self._disconnect(ssid, now, signal=rng.randint(1, 100))
+                self.assertEqual(scored[-1], expected)
+                
+                # Any alert this raised is emitted here, as the monitor loop would
+                monitor._drain_alerts()
+            
+            now += 600.0  # Idle gap between sessions
+        
+        self.assertGreater(len(scored), 100)
+
 class TestWindowsWiFiMonitor(unittest.TestCase):
     """Test Windows WiFi monitoring functionality"""
     
@@ -163,7 +415,7 @@ class TestDiscordWebhook(unittest.TestCase):
         self.webhook_url = "https://discord.com/api/webhooks/test/webhook"
         self.discord = DiscordWebhook(self.webhook_url)
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_alert_success(self, mock_post):
         """Test successful Discord alert"""
         mock_response = MagicMock()
@@ -181,9 +433,11 @@ class TestDiscordWebhook(unittest.TestCase):
         
         # Verify correct payload structure
         call_args = mock_post.call_args
-        self.assertEqual(call_args[1]['json']['embeds'][0]['title'], "🚨 WiFi Deauth Attack Detected!")
+        payload = json.loads(call_args[1]['data'])
+        self.assertEqual(payload['embeds'][0]['title'], "🚨 WiFi Deauth Attack Detected!")
+        self.assertEqual(call_args[1]['headers']['Content-Type'], "application/json")
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_alert_failure(self, mock_post):
         """Test failed Discord alert"""
         mock_post.side_effect = Exception("Network error")
@@ -213,6 +467,11 @@ def run_tests():
     # Add test cases
     test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestSettingsManager))
     test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestNetworkManager))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestSecureNetworkManager))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestThreatScoring))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestSignalSpread))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestDisconnectRing))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestEnhancedThreatInputs))
     test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestWindowsWiFiMonitor))
     test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestDiscordWebhook))
     
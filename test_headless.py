@@ -114,7 +114,7 @@ def test_discord_webhook():
         # Test with mock webhook URL
         discord = DiscordWebhook("https://discord.com/api/webhooks/test/url")
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.return_value.status_code = 200
             result = discord.send_alert("00:11:22:33:44:55", "aa:bb:cc:dd:ee:ff", "2024-08-03 17:30:15")
             print(f"✅ Webhook alert test: {result}")
@@ -139,10 +139,10 @@ def test_detection_engine():
         
         # Test detection signal
         signal_received = False
-        def on_attack_detected(attacker, target, timestamp):
+        def on_attack_detected(event):
             nonlocal signal_received
             signal_received = True
-            print(f"✅ Attack signal received: {attacker} → {target} at {timestamp}")
+            print(f"✅ Attack signal received: {event['reason']} → {event['details']} at {event['timestamp']}")
         
         detector.attack_detected.connect(on_attack_detected)
         
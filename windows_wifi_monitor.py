@@ -27,6 +27,10 @@ class WindowsWiFiMonitor(QObject):
         self.disconnect_history = []
         self.last_check_time = datetime.now()
         
+        # Optional plain callback (reason, timestamp, details); when set it is
+        # called directly instead of emitting the Qt signal
+        self.on_event = None
+        
         # Suspicious disconnect reason codes (common in deauth attacks)
         self.suspicious_reasons = {
             1: "Unspecified reason",
@@ -161,6 +165,13 @@ class WindowsWiFiMonitor(QObject):
             details = f"Disconnected from {disconnect_info['ssid']}"
             
             # Emit signal for immediate notification
+            self._notify(reason, timestamp, details)
+    
+    def _notify(self, reason, timestamp, details):
+        """Deliver a suspicious event to the callback or the Qt signal"""
+        if self.on_event is not None:
+            self.on_event(reason, timestamp, details)
+        else:
             self.suspicious_disconnect.emit(reason, timestamp, details)
     
     def _analyze_disconnect_patterns(self):
@@ -182,7 +193,7 @@ class WindowsWiFiMonitor(QObject):
             timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
             details = f"{len(recent_disconnects)} disconnects in {self.suspicious_window_minutes} minutes"
             
-            self.suspicious_disconnect.emit(reason, timestamp, details)
+            self._notify(reason, timestamp, details)
             
             # Clear history to avoid duplicate alerts
             self.disconnect_history.clear()
@@ -235,6 +246,10 @@ class LegacyDeauthDetector(QObject):
         self.is_monitoring = False
         self.monitor_thread = None
         
+        # Optional plain callback (attacker_mac, target_mac, timestamp); when
+        # set it is called directly instead of emitting the Qt signal
+        self.on_event = None
+        
     def start_monitoring(self):
         """Start simulated monitoring for demo purposes"""
         if not self.is_monitoring:
@@ -258,4 +273,7 @@ class LegacyDeauthDetector(QObject):
                 target_mac = f"aa:bb:cc:{random.randint(10,99):02d}:{random.randint(10,99):02d}:{random.randint(10,99):02d}"
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
-                self.attack_detected.emit(attacker_mac, target_mac, timestamp)
\ No newline at end of file
+                if self.on_event is not None:
+                    self.on_event(attacker_mac, target_mac, timestamp)
+                else:
+                    self.attack_detected.emit(attacker_mac, target_mac, timestamp)
\ No newline at end of file
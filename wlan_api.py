@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Native Windows WLAN API access
+Thin ctypes wrapper over wlanapi.dll so WiFi state can be read in-process
+instead of spawning netsh and parsing its output
+"""
+
+import os
+import ctypes
+import logging
+import xml.etree.ElementTree as ET
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+ERROR_SUCCESS = 0
+WLAN_CLIENT_VERSION = 2  # Windows Vista and later
+
+# WLAN_INTF_OPCODE values
+OPCODE_CURRENT_CONNECTION = 7
+OPCODE_CHANNEL_NUMBER = 8
+
+# Notification sources and the codes the monitor reacts to
+NOTIFICATION_SOURCE_ACM = 0x08
+NOTIFICATION_SOURCE_MSM = 0x10
+ACM_CONNECTION_COMPLETE = 10
+ACM_DISCONNECTED = 21
+MSM_SIGNAL_QUALITY_CHANGE = 8
+MSM_DISCONNECTED = 10
+
+# WLAN_INTERFACE_STATE values, named the way netsh reports them
+STATE_CONNECTED = 1
+INTERFACE_STATES = {
+    0: 'not ready',
+    1: 'connected',
+    2: 'ad hoc network formed',
+    3: 'disconnecting',
+    4: 'disconnected',
+    5: 'associating',
+    6: 'discovering',
+    7: 'authenticating',
+}
+
+# DOT11_AUTH_ALGORITHM / DOT11_CIPHER_ALGORITHM values, named as netsh shows them
+AUTH_ALGORITHMS = {
+    1: 'Open',
+    2: 'Shared',
+    3: 'WPA-Enterprise',
+    4: 'WPA-Personal',
+    5: 'WPA-None',
+    6: 'WPA2-Enterprise',
+    7: 'WPA2-Personal',
+    8: 'WPA3-Enterprise 192 Bits',
+    9: 'WPA3-Personal',
+    10: 'OWE',
+    11: 'WPA3-Enterprise',
+}
+CIPHER_ALGORITHMS = {
+    0: 'None',
+    1: 'WEP',
+    2: 'TKIP',
+    4: 'CCMP',
+    5: 'WEP',
+    6: 'BIP',
+    8: 'GCMP',
+    9: 'GCMP-256',
+    10: 'CCMP-256',
+    0x100: 'Group',
+    0x101: 'WEP',
+}
+
+PROFILE_NAMESPACE = {'w': 'http://www.microsoft.com/networking/WLAN/profile/v1'}
+
+DWORD = ctypes.c_uint32
+
+
+class GUID(ctypes.Structure):
+    _fields_ = [
+        ('Data1', DWORD),
+        ('Data2', ctypes.c_ushort),
+        ('Data3', ctypes.c_ushort),
+        ('Data4', ctypes.c_ubyte * 8),
+    ]
+
+
+class WLAN_INTERFACE_INFO(ctypes.Structure):
+    _fields_ = [
+        ('InterfaceGuid', GUID),
+        ('strInterfaceDescription', ctypes.c_wchar * 256),
+        ('isState', DWORD),
+    ]
+
+
+class WLAN_INTERFACE_INFO_LIST(ctypes.Structure):
+    _fields_ = [
+        ('dwNumberOfItems', DWORD),
+        ('dwIndex', DWORD),
+        ('InterfaceInfo', WLAN_INTERFACE_INFO * 1),  # Variable length
+    ]
+
+
+class DOT11_SSID(ctypes.Structure):
+    _fields_ = [
+        ('uSSIDLength', DWORD),
+        ('ucSSID', ctypes.c_ubyte * 32),
+    ]
+
+
+class WLAN_ASSOCIATION_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('dot11Ssid', DOT11_SSID),
+        ('dot11BssType', DWORD),
+        ('dot11Bssid', ctypes.c_ubyte * 6),
+        ('dot11PhyType', DWORD),
+        ('uDot11PhyIndex', DWORD),
+        ('wlanSignalQuality', DWORD),
+        ('ulRxRate', DWORD),
+        ('ulTxRate', DWORD),
+    ]
+
+
+class WLAN_SECURITY_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('bSecurityEnabled', ctypes.c_int),
+        ('bOneXEnabled', ctypes.c_int),
+        ('dot11AuthAlgorithm', DWORD),
+        ('dot11CipherAlgorithm', DWORD),
+    ]
+
+
+class WLAN_CONNECTION_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('isState', DWORD),
+        ('wlanConnectionMode', DWORD),
+        ('strProfileName', ctypes.c_wchar * 256),
+        ('wlanAssociationAttributes', WLAN_ASSOCIATION_ATTRIBUTES),
+        ('wlanSecurityAttributes', WLAN_SECURITY_ATTRIBUTES),
+    ]
+
+
+class WLAN_PROFILE_INFO(ctypes.Structure):
+    _fields_ = [
+        ('strProfileName', ctypes.c_wchar * 256),
+        ('dwFlags', DWORD),
+    ]
+
+
+class WLAN_PROFILE_INFO_LIST(ctypes.Structure):
+    _fields_ = [
+        ('dwNumberOfItems', DWORD),
+        ('dwIndex', DWORD),
+        ('ProfileInfo', WLAN_PROFILE_INFO * 1),  # Variable length
+    ]
+
+
+class WLAN_NOTIFICATION_DATA(ctypes.Structure):
+    _fields_ = [
+        ('NotificationSource', DWORD),
+        ('NotificationCode', DWORD),
+        ('InterfaceGuid', GUID),
+        ('dwDataSize', DWORD),
+        ('pData', ctypes.c_void_p),
+    ]
+
+
+class WlanClient:
+    """Open handle to the WLAN AutoConfig service"""
+
+    def __init__(self):
+        self._dll = ctypes.WinDLL('wlanapi.dll')
+        self._declare_functions()
+        self._handle = ctypes.c_void_p()
+        self._interface_guid = None
+        self._notification_callback = None  # Keeps the ctypes thunk alive
+
+        negotiated_version = DWORD()
+        ret = self._dll.WlanOpenHandle(WLAN_CLIENT_VERSION, None,
+                                       ctypes.byref(negotiated_version),
+                                       ctypes.byref(self._handle))
+        if ret != ERROR_SUCCESS:
+            raise OSError(ret, "WlanOpenHandle failed")
+
+    def _declare_functions(self):
+        """Declare argument types so ctypes passes handles and pointers correctly"""
+        dll = self._dll
+        dll.WlanOpenHandle.argtypes = [DWORD, ctypes.c_void_p, ctypes.POINTER(DWORD),
+                                       ctypes.POINTER(ctypes.c_void_p)]
+        dll.WlanOpenHandle.restype = DWORD
+        dll.WlanCloseHandle.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        dll.WlanCloseHandle.restype = DWORD
+        dll.WlanFreeMemory.argtypes = [ctypes.c_void_p]
+        dll.WlanFreeMemory.restype = None
+        dll.WlanEnumInterfaces.argtypes = [ctypes.c_void_p, ctypes.c_void_p,
+                                           ctypes.POINTER(ctypes.POINTER(WLAN_INTERFACE_INFO_LIST))]
+        dll.WlanEnumInterfaces.restype = DWORD
+        dll.WlanQueryInterface.argtypes = [ctypes.c_void_p, ctypes.POINTER(GUID), DWORD,
+                                           ctypes.c_void_p, ctypes.POINTER(DWORD),
+                                           ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(DWORD)]
+        dll.WlanQueryInterface.restype = DWORD
+        dll.WlanGetProfile.argtypes = [ctypes.c_void_p, ctypes.POINTER(GUID), ctypes.c_wchar_p,
+                                       ctypes.c_void_p, ctypes.POINTER(ctypes.c_wchar_p),
+                                       ctypes.POINTER(DWORD), ctypes.POINTER(DWORD)]
+        dll.WlanGetProfile.restype = DWORD
+        dll.WlanGetProfileList.argtypes = [ctypes.c_void_p, ctypes.POINTER(GUID), ctypes.c_void_p,
+                                           ctypes.POINTER(ctypes.POINTER(WLAN_PROFILE_INFO_LIST))]
+        dll.WlanGetProfileList.restype = DWORD
+        dll.WlanRegisterNotification.argtypes = [ctypes.c_void_p, DWORD, ctypes.c_int, ctypes.c_void_p,
+                                                 ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(DWORD)]
+        dll.WlanRegisterNotification.restype = DWORD
+
+    def close(self):
+        """Close the WLAN client handle"""
+        if self._handle:
+            # Closing the handle also cancels any notification registration
+            self._dll.WlanCloseHandle(self._handle, None)
+            self._handle = ctypes.c_void_p()
+            self._notification_callback = None
+
+    def register_notifications(self, callback, sources=NOTIFICATION_SOURCE_ACM | NOTIFICATION_SOURCE_MSM):
+        """
+        Call callback(source, code) for each WLAN notification from the given
+        sources. It runs on a WLAN service thread, so it should only hand the
+        event off and return.
+        """
+        def on_notification(data, context):
+            try:
+                callback(data.contents.NotificationSource, data.contents.NotificationCode)
+            except Exception as e:
+                logger.error(f"Error in WLAN notification callback: {e}")
+        
+        callback_type = ctypes.WINFUNCTYPE(None, ctypes.POINTER(WLAN_NOTIFICATION_DATA), ctypes.c_void_p)
+        thunk = callback_type(on_notification)
+        ret = self._dll.WlanRegisterNotification(self._handle, sources, True, thunk, None, None, None)
+        if ret != ERROR_SUCCESS:
+            raise OSError(ret, "WlanRegisterNotification failed")
+        self._notification_callback = thunk
+
+    def get_interfaces(self):
+        """Return (guid, description, state) for each wireless interface"""
+        info_list = ctypes.POINTER(WLAN_INTERFACE_INFO_LIST)()
+        ret = self._dll.WlanEnumInterfaces(self._handle, None, ctypes.byref(info_list))
+        if ret != ERROR_SUCCESS:
+            raise OSError(ret, "WlanEnumInterfaces failed")
+
+        try:
+            count = info_list.contents.dwNumberOfItems
+            entries = (WLAN_INTERFACE_INFO * count).from_address(
+                ctypes.addressof(info_list.contents.InterfaceInfo))
+            return [
+                (GUID.from_buffer_copy(entry.InterfaceGuid), entry.strInterfaceDescription, entry.isState)
+                for entry in entries
+            ]
+        finally:
+            self._dll.WlanFreeMemory(info_list)
+
+    def _query_interface(self, guid, opcode, result_type):
+        """Run WlanQueryInterface and copy the result out of WLAN-owned memory"""
+        data_size = DWORD()
+        data = ctypes.c_void_p()
+        ret = self._dll.WlanQueryInterface(self._handle, ctypes.byref(guid), opcode, None,
+                                           ctypes.byref(data_size), ctypes.byref(data), None)
+        if ret != ERROR_SUCCESS:
+            return None
+
+        try:
+            return result_type.from_buffer_copy(ctypes.string_at(data, ctypes.sizeof(result_type)))
+        finally:
+            self._dll.WlanFreeMemory(data)
+
+    def get_status(self):
+        """
+        Return the first wireless interface's status in the same shape the
+        netsh parser produces, or None if there is no wireless interface
+        """
+        interfaces = self.get_interfaces()
+        if not interfaces:
+            return None
+
+        guid, _, state = interfaces[0]
+        self._interface_guid = guid
+        status = {
+            'state': INTERFACE_STATES.get(state, 'unknown'),
+            'connected': state == STATE_CONNECTED,
+        }
+        if not status['connected']:
+            return status
+
+        connection = self._query_interface(guid, OPCODE_CURRENT_CONNECTION, WLAN_CONNECTION_ATTRIBUTES)
+        if connection is not None:
+            association = connection.wlanAssociationAttributes
+            security = connection.wlanSecurityAttributes
+            ssid = bytes(association.dot11Ssid.ucSSID[:association.dot11Ssid.uSSIDLength])
+            status.update({
+                'ssid': ssid.decode('utf-8', errors='replace') or None,
+                'bssid': bytes(association.dot11Bssid).hex(':'),
+                'signal': association.wlanSignalQuality,
+                'profile': connection.strProfileName,
+                'auth_type': AUTH_ALGORITHMS.get(security.dot11AuthAlgorithm, 'Unknown'),
+                'cipher': CIPHER_ALGORITHMS.get(security.dot11CipherAlgorithm, 'Unknown'),
+            })
+
+        channel = self._query_interface(guid, OPCODE_CHANNEL_NUMBER, DWORD)
+        if channel is not None:
+            status['channel'] = channel.value
+
+        return status
+
+    def get_profile_info(self, profile_name):
+        """Return security details of a saved profile without reading its key"""
+        if not profile_name or self._interface_guid is None:
+            return {}
+
+        profile_xml = ctypes.c_wchar_p()
+        flags = DWORD(0)  # No WLAN_PROFILE_GET_PLAINTEXT_KEY: the key stays encrypted
+        ret = self._dll.WlanGetProfile(self._handle, ctypes.byref(self._interface_guid), profile_name,
+                                       None, ctypes.byref(profile_xml), ctypes.byref(flags), None)
+        if ret != ERROR_SUCCESS:
+            return {}
+
+        try:
+            root = ET.fromstring(profile_xml.value)
+        except ET.ParseError as e:
+            logger.debug(f"Could not parse profile XML for {profile_name}: {e}")
+            return {}
+        finally:
+            self._dll.WlanFreeMemory(profile_xml)
+
+        return {
+            'has_password': root.find('.//w:sharedKey', PROFILE_NAMESPACE) is not None,
+            'key_configured': bool(root.findtext('.//w:keyMaterial', '', PROFILE_NAMESPACE)),
+            'auto_connect': root.findtext('w:connectionMode', '', PROFILE_NAMESPACE) == 'auto',
+        }
+
+    def get_profile_names(self):
+        """Return the names of saved profiles across all wireless interfaces"""
+        names = []
+        for guid, _, _ in self.get_interfaces():
+            info_list = ctypes.POINTER(WLAN_PROFILE_INFO_LIST)()
+            ret = self._dll.WlanGetProfileList(self._handle, ctypes.byref(guid), None,
+                                               ctypes.byref(info_list))
+            if ret != ERROR_SUCCESS:
+                raise OSError(ret, "WlanGetProfileList failed")
+
+            try:
+                count = info_list.contents.dwNumberOfItems
+                entries = (WLAN_PROFILE_INFO * count).from_address(
+                    ctypes.addressof(info_list.contents.ProfileInfo))
+                for entry in entries:
+                    if entry.strProfileName not in names:
+                        names.append(entry.strProfileName)
+            finally:
+                self._dll.WlanFreeMemory(info_list)
+
+        return names
+
+
+def list_profiles():
+    """Return saved profile names via a short-lived client, or None to fall back to netsh"""
+    client = open_client()
+    if client is None:
+        return None
+
+    try:
+        return client.get_profile_names()
+    except OSError as e:
+        logger.warning(f"WLAN profile list failed, using netsh: {e}")
+        return None
+    finally:
+        client.close()
+
+
+def open_client():
+    """Open a WLAN API client, or return None where wlanapi.dll is unavailable"""
+    if os.name != 'nt':
+        return None
+
+    try:
+        return WlanClient()
+    except (OSError, AttributeError) as e:
+        logger.info(f"WLAN API unavailable, falling back to netsh: {e}")
+        return None